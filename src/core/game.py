@@ -18,8 +18,9 @@ TEMPORAL DEBT 2.0 - Added new systems:
 - Fragment Collection
 """
 
+import time
 import pygame
-from enum import Enum, auto
+from enum import IntEnum, auto
 from typing import Optional
 
 from .settings import Settings, COLORS
@@ -46,8 +47,27 @@ from ..ui.feedback import ScreenEffects, ParticleSystem
 from ..ui.tutorial import TutorialOverlay, ControlsDisplay, GameTips
 
 
-class GameState(Enum):
-    """Game state machine states."""
+# Event types the game actually routes; everything else is blocked at the
+# SDL level so it never gets materialized into pygame Event objects.
+_HANDLED_EVENTS = (
+    pygame.QUIT,
+    pygame.KEYDOWN,
+    pygame.KEYUP,
+    pygame.MOUSEMOTION,       # Menu hover
+    pygame.MOUSEBUTTONDOWN,   # Menu click
+)
+
+# Fallback effect position for events that carry no position
+_SCREEN_CENTER = (Settings.SCREEN_WIDTH // 2, Settings.SCREEN_HEIGHT // 2)
+
+
+class GameState(IntEnum):
+    """
+    Game state machine states.
+    
+    IntEnum so state comparisons and dict lookups keyed on the state
+    use plain int equality and hashing.
+    """
     MAIN_MENU = auto()
     CONTROLS = auto()
     TUTORIAL = auto()
@@ -88,6 +108,10 @@ class Game:
         
         pygame.display.set_caption(Settings.TITLE + " 2.0")
         
+        # Only queue the events we handle
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(_HANDLED_EVENTS)
+        
         # Get or create display (reuses existing display if already created)
         try:
             self.screen = pygame.display.get_surface()
@@ -104,10 +128,15 @@ class Game:
         
         self.clock = pygame.time.Clock()
         
-        # Create game surface for effects
+        # Fixed-timestep loop state
+        self._last_frame_time = time.perf_counter()
+        self._accumulator = 0.0
+        
+        # Create game surface for effects (display format, so the
+        # per-frame blit to the screen needs no pixel conversion)
         self.game_surface = pygame.Surface(
             (Settings.SCREEN_WIDTH, Settings.SCREEN_HEIGHT)
-        )
+        ).convert()
         
         # Game state
         self.running = True
@@ -154,6 +183,18 @@ class Game:
         self.game_tips = GameTips()
         self.show_tutorial = True  # Flag for first-time players
         
+        # Gameplay hotkeys, keyed by pygame key code
+        self._gameplay_keydown = {
+            pygame.K_ESCAPE: self._key_pause,
+            pygame.K_q: self._key_place_anchor,
+            pygame.K_e: self._key_recall_anchor,
+            pygame.K_TAB: self.controls_display.toggle,
+            # V2.0 Controls
+            pygame.K_c: self._key_spawn_clone,
+            pygame.K_r: self._key_rewind,
+            pygame.K_b: self._key_fragment_burst,
+        }
+        
         # Audio System
         self.audio: Optional[AudioManager] = None
         try:
@@ -185,7 +226,7 @@ class Game:
     
     def _on_player_died(self, event_data) -> None:
         """Handle player death event."""
-        pos = event_data.data.get('position', (Settings.SCREEN_WIDTH // 2, Settings.SCREEN_HEIGHT // 2))
+        pos = event_data.data.get('position', _SCREEN_CENTER)
         self.screen_effects.flash(COLORS.TIER_BANKRUPTCY, 200)
         self.screen_effects.trigger_shake(15)
         self.particles.emit(
@@ -252,9 +293,9 @@ class Game:
     
     def _init_game_systems(self) -> None:
         """Initialize game systems for a new game."""
-        # Reset event manager
-        reset_event_manager()
-        self.event_manager = get_event_manager()
+        # Drop the previous game's listeners but keep the event manager
+        # instance (and the systems' references to it) alive
+        self.event_manager.clear_listeners()
         self._subscribe_to_events()
         
         # Create debt manager first (time engine needs it)
@@ -327,6 +368,7 @@ class Game:
         """Start a new game."""
         self._init_game_systems()
         self.level_manager.load_level(0)
+        self._reset_step_clock()
         
         # Show tutorial for first level
         if self.show_tutorial:
@@ -334,17 +376,34 @@ class Game:
         else:
             self.state = GameState.PLAYING
     
+    def _reset_step_clock(self) -> None:
+        """Drop time banked while a level loads so play starts on one step."""
+        self._last_frame_time = time.perf_counter()
+        self._accumulator = 0.0
+    
     def run(self) -> None:
-        """Main game loop - single frame execution for web compatibility."""
-        # Calculate delta time
-        dt = self.clock.tick(Settings.FPS) / 1000.0
-        dt = min(dt, 0.1)  # Cap dt to prevent spiral of death
+        """
+        Main game loop - single frame execution for web compatibility.
+        
+        Update and render deliberately share one thread: pygame display
+        calls must stay on the main thread, and the pygbag build drives
+        this method once per asyncio tick with no thread support.
+        """
+        # Cap the render rate; simulation time comes from the perf counter
+        self.clock.tick(Settings.FPS)
+        now = time.perf_counter()
+        frame_time = min(now - self._last_frame_time, Settings.MAX_FRAME_TIME)
+        self._last_frame_time = now
+        self._accumulator += frame_time
         
         # Handle events
         self._handle_events()
         
-        # Update based on state
-        self._update(dt)
+        # Step the simulation in fixed increments
+        step = Settings.FIXED_DT
+        while self._accumulator >= step:
+            self._update(step)
+            self._accumulator -= step
         
         # Render
         self._render()
@@ -360,7 +419,7 @@ class Game:
     
     def _handle_events(self) -> None:
         """Process pygame events."""
-        for event in pygame.event.get():
+        for event in pygame.event.get(_HANDLED_EVENTS):
             if event.type == pygame.QUIT:
                 self.running = False
                 return
@@ -436,90 +495,92 @@ class Game:
     def _handle_gameplay_event(self, event: pygame.event.Event) -> None:
         """Handle events during gameplay."""
         if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_ESCAPE:
-                self.state = GameState.PAUSED
-            
-            elif event.key == pygame.K_q:
-                # Place anchor
-                if self.anchor_system and self.level_manager and self.level_manager.player:
-                    success = self.anchor_system.place_anchor(
-                        self.level_manager.player.center
+            handler = self._gameplay_keydown.get(event.key)
+            if handler:
+                handler()
+    
+    def _key_pause(self) -> None:
+        """ESC - pause the game."""
+        self.state = GameState.PAUSED
+    
+    def _key_place_anchor(self) -> None:
+        """Q - place an anchor at the player's position."""
+        if self.anchor_system and self.level_manager and self.level_manager.player:
+            success = self.anchor_system.place_anchor(
+                self.level_manager.player.center
+            )
+            if success:
+                self.particles.emit(
+                    self.level_manager.player.center,
+                    count=15,
+                    color=COLORS.ANCHOR,
+                    speed=50,
+                    lifetime=0.5
+                )
+                if self.audio:
+                    self.audio.play(SoundType.ANCHOR_PLACE)
+    
+    def _key_recall_anchor(self) -> None:
+        """E - recall to the nearest anchor."""
+        if self.anchor_system and self.level_manager and self.level_manager.player:
+            new_pos = self.anchor_system.recall_to_nearest(
+                self.level_manager.player.center
+            )
+            if new_pos:
+                old_pos = self.level_manager.player.center
+                self.level_manager.player.position = new_pos
+                self.screen_effects.flash(COLORS.ANCHOR, 100)
+                self.particles.emit_many(
+                    [old_pos, new_pos], [20, 25],
+                    color=COLORS.ANCHOR, speeds=[80, 100]
+                )
+                if self.audio:
+                    self.audio.play(SoundType.ANCHOR_RECALL)
+    
+    def _key_spawn_clone(self) -> None:
+        """C - spawn a chrono-clone."""
+        if self.clone_system and self.clone_system.can_spawn_clone:
+            if self.clone_system.spawn_clone():
+                self.screen_effects.flash((150, 200, 255), 80)
+                if self.level_manager and self.level_manager.player:
+                    self.particles.emit(
+                        self.level_manager.player.center,
+                        count=20,
+                        color=(150, 200, 255),
+                        speed=80,
+                        lifetime=0.6
                     )
-                    if success:
-                        self.particles.emit(
-                            self.level_manager.player.center,
-                            count=15,
-                            color=COLORS.ANCHOR,
-                            speed=50,
-                            lifetime=0.5
-                        )
-                        if self.audio:
-                            self.audio.play(SoundType.ANCHOR_PLACE)
-            
-            elif event.key == pygame.K_e:
-                # Recall to anchor
-                if self.anchor_system and self.level_manager and self.level_manager.player:
-                    new_pos = self.anchor_system.recall_to_nearest(
-                        self.level_manager.player.center
+                if self.audio:
+                    self.audio.play(SoundType.CLONE_SPAWN)
+    
+    def _key_rewind(self) -> None:
+        """R - time reversal (V2) or restart level (debug)."""
+        if self.reversal_system and self.reversal_system.can_rewind:
+            snapshot = self.reversal_system.initiate_rewind()
+            if snapshot and self.level_manager and self.level_manager.player:
+                # Restore player position
+                self.level_manager.player.position = snapshot.player_position
+                self.screen_effects.flash((200, 150, 255), 200)
+                if self.audio:
+                    self.audio.play(SoundType.REWIND_ACTIVATE)
+        elif Settings.DEBUG_MODE:
+            self._restart_level()
+    
+    def _key_fragment_burst(self) -> None:
+        """B - activate slow-motion burst from fragments."""
+        if self.fragment_manager and self.fragment_manager.can_burst:
+            if self.fragment_manager.activate_burst():
+                self.screen_effects.flash((200, 220, 255), 150)
+                if self.level_manager and self.level_manager.player:
+                    self.particles.emit(
+                        self.level_manager.player.center,
+                        count=30,
+                        color=(200, 220, 255),
+                        speed=100,
+                        lifetime=0.8
                     )
-                    if new_pos:
-                        old_pos = self.level_manager.player.center
-                        self.level_manager.player.position = new_pos
-                        self.screen_effects.flash(COLORS.ANCHOR, 100)
-                        self.particles.emit(old_pos, count=20, color=COLORS.ANCHOR, speed=80)
-                        self.particles.emit(new_pos, count=25, color=COLORS.ANCHOR, speed=100)
-                        if self.audio:
-                            self.audio.play(SoundType.ANCHOR_RECALL)
-            
-            elif event.key == pygame.K_TAB:
-                # Toggle controls display
-                self.controls_display.toggle()
-            
-            # V2.0 Controls
-            elif event.key == pygame.K_c:
-                # Spawn chrono-clone
-                if self.clone_system and self.clone_system.can_spawn_clone:
-                    if self.clone_system.spawn_clone():
-                        self.screen_effects.flash((150, 200, 255), 80)
-                        if self.level_manager and self.level_manager.player:
-                            self.particles.emit(
-                                self.level_manager.player.center,
-                                count=20,
-                                color=(150, 200, 255),
-                                speed=80,
-                                lifetime=0.6
-                            )
-                        if self.audio:
-                            self.audio.play(SoundType.CLONE_SPAWN)
-            
-            elif event.key == pygame.K_r:
-                # Time reversal (V2) or restart level (debug)
-                if self.reversal_system and self.reversal_system.can_rewind:
-                    snapshot = self.reversal_system.initiate_rewind()
-                    if snapshot and self.level_manager and self.level_manager.player:
-                        # Restore player position
-                        self.level_manager.player.position = snapshot.player_position
-                        self.screen_effects.flash((200, 150, 255), 200)
-                        if self.audio:
-                            self.audio.play(SoundType.REWIND_ACTIVATE)
-                elif Settings.DEBUG_MODE:
-                    self._restart_level()
-            
-            elif event.key == pygame.K_b:
-                # Activate slow-motion burst from fragments
-                if self.fragment_manager and self.fragment_manager.can_burst:
-                    if self.fragment_manager.activate_burst():
-                        self.screen_effects.flash((200, 220, 255), 150)
-                        if self.level_manager and self.level_manager.player:
-                            self.particles.emit(
-                                self.level_manager.player.center,
-                                count=30,
-                                color=(200, 220, 255),
-                                speed=100,
-                                lifetime=0.8
-                            )
-                        if self.audio:
-                            self.audio.play(SoundType.FRAGMENT_BURST)
+                if self.audio:
+                    self.audio.play(SoundType.FRAGMENT_BURST)
     
     def _update(self, dt: float) -> None:
         """Update game state."""
@@ -585,7 +646,8 @@ class Game:
         # Check for death timer (delayed game over)
         if self._death_timer > 0:
             self._death_timer -= dt
-            self.particles.update(dt)
+            if self.particles.particles:
+                self.particles.update(dt)
             if self._death_timer <= 0:
                 cause = "Caught by enemy!"
                 if self.debt_manager and self.debt_manager.current_debt >= Settings.BANKRUPTCY_THRESHOLD:
@@ -657,7 +719,7 @@ class Game:
         player_moving = False
         if self.level_manager and self.level_manager.player:
             player = self.level_manager.player
-            player_moving = player.velocity.magnitude() > 0
+            player_moving = player.velocity.magnitude_squared() > 0
         
         # Update momentum system
         if self.momentum_system:
@@ -711,8 +773,9 @@ class Game:
         if self.hud:
             self.hud.update(dt)
         
-        # Update particles
-        self.particles.update(dt)
+        # Update particles (skipped when none are alive)
+        if self.particles.particles:
+            self.particles.update(dt)
         
         # Track stats
         self.total_play_time += dt
@@ -979,6 +1042,7 @@ class Game:
         self.screen_effects.reset()
         self._death_timer = 0
         self._space_held = False
+        self._reset_step_clock()
         self.state = GameState.PLAYING
     
     def _next_level(self) -> None:
@@ -1006,6 +1070,7 @@ class Game:
             
             self.particles.clear()
             self.screen_effects.reset()
+            self._reset_step_clock()
             self.state = GameState.PLAYING
         else:
             self.state = GameState.MAIN_MENU
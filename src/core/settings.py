@@ -27,6 +27,8 @@ class Settings:
     SCREEN_WIDTH = 1280
     SCREEN_HEIGHT = 720
     FPS = 60
+    FIXED_DT = 1.0 / 120          # Simulation step, independent of render rate
+    MAX_FRAME_TIME = 0.1          # Clamp on real frame time (prevents spiral of death)
     TITLE = "TEMPORAL DEBT"
     
     TILE_SIZE = 48
@@ -7,16 +7,22 @@ These are generic helpers that don't belong to any specific system.
 import math
 from typing import Tuple
 
+from pygame.math import Vector2 as _PV2
 
-class Vector2:
+
+class Vector2(_PV2):
     """
-    Simple 2D vector class for game mathematics.
+    2D vector class for game mathematics.
     
     Design Decision:
-    While pygame has pygame.math.Vector2, we implement our own for:
-    - Learning purposes (good for portfolio)
-    - Custom methods specific to our needs
-    - Type consistency throughout codebase
+    Subclasses pygame.math.Vector2 so arithmetic, copy() and the
+    length/distance queries run in C, while keeping the API the rest of
+    the codebase was written against:
+    - Angles are radians (rotated, angle_to, from_angle)
+    - normalize() works in place; normalized() returns a copy
+    - Zero vectors normalize and divide to (0, 0) instead of raising
+    - lerp() clamps t instead of raising
+    - Equality uses a 0.0001 tolerance, and every vector is truthy
     
     Usage:
         pos = Vector2(100, 200)
@@ -24,44 +30,34 @@ class Vector2:
         new_pos = pos + vel * dt
     """
     
-    __slots__ = ('x', 'y')  # Memory optimization
+    __slots__ = ()  # No per-instance __dict__
     
     def __init__(self, x: float = 0, y: float = 0):
-        self.x = float(x)
-        self.y = float(y)
-    
-    def __add__(self, other: 'Vector2') -> 'Vector2':
-        return Vector2(self.x + other.x, self.y + other.y)
-    
-    def __sub__(self, other: 'Vector2') -> 'Vector2':
-        return Vector2(self.x - other.x, self.y - other.y)
-    
-    def __mul__(self, scalar: float) -> 'Vector2':
-        return Vector2(self.x * scalar, self.y * scalar)
-    
-    def __rmul__(self, scalar: float) -> 'Vector2':
-        return self.__mul__(scalar)
+        super().__init__(x, y)
     
     def __truediv__(self, scalar: float) -> 'Vector2':
         if scalar == 0:
             return Vector2(0, 0)
-        return Vector2(self.x / scalar, self.y / scalar)
-    
-    def __neg__(self) -> 'Vector2':
-        return Vector2(-self.x, -self.y)
+        return _PV2.__truediv__(self, scalar)
     
     def __eq__(self, other: 'Vector2') -> bool:
         if not isinstance(other, Vector2):
             return False
         return abs(self.x - other.x) < 0.0001 and abs(self.y - other.y) < 0.0001
     
+    def __ne__(self, other: 'Vector2') -> bool:
+        return not self.__eq__(other)
+    
+    __hash__ = None
+    
+    def __bool__(self) -> bool:
+        # Vectors are values, not containers: (0, 0) is still a position
+        return True
+    
     def __repr__(self) -> str:
         return f"Vector2({self.x:.2f}, {self.y:.2f})"
     
-    def __iter__(self):
-        """Allow unpacking: x, y = vector"""
-        yield self.x
-        yield self.y
+    __str__ = __repr__
     
     @property
     def tuple(self) -> Tuple[float, float]:
@@ -73,52 +69,54 @@ class Vector2:
         """Get as integer tuple for pixel positions."""
         return (int(self.x), int(self.y))
     
-    def copy(self) -> 'Vector2':
-        """Create a copy of this vector."""
-        return Vector2(self.x, self.y)
+    def set(self, x: float, y: float) -> 'Vector2':
+        """Overwrite both components in place and return self."""
+        self.update(x, y)
+        return self
+    
+    def iadd(self, other: 'Vector2') -> 'Vector2':
+        """Add another vector in place and return self."""
+        self += other
+        return self
     
-    def magnitude(self) -> float:
-        """Get the length of this vector."""
-        return math.sqrt(self.x ** 2 + self.y ** 2)
+    def isub(self, other: 'Vector2') -> 'Vector2':
+        """Subtract another vector in place and return self."""
+        self -= other
+        return self
     
-    def magnitude_squared(self) -> float:
-        """Get squared length (faster, for comparisons)."""
-        return self.x ** 2 + self.y ** 2
+    def imul(self, scalar: float) -> 'Vector2':
+        """Scale in place and return self."""
+        self *= scalar
+        return self
     
     def normalized(self) -> 'Vector2':
         """Get a unit vector in the same direction."""
-        mag = self.magnitude()
+        if self.x == 0 and self.y == 0:
+            return Vector2(0, 0)
+        return _PV2.normalize(self)
+    
+    def normalized_scaled(self, length: float) -> 'Vector2':
+        """
+        Get a vector of the given length in the same direction.
+        
+        Same as normalized() * length, but scales once by
+        length / magnitude instead of dividing and then multiplying.
+        """
+        mag = math.hypot(self.x, self.y)
         if mag == 0:
             return Vector2(0, 0)
-        return Vector2(self.x / mag, self.y / mag)
+        scale = length / mag
+        return Vector2(self.x * scale, self.y * scale)
     
     def normalize(self) -> 'Vector2':
         """Normalize in place and return self."""
-        mag = self.magnitude()
-        if mag > 0:
-            self.x /= mag
-            self.y /= mag
+        if self.x != 0 or self.y != 0:
+            self.normalize_ip()
         return self
     
-    def dot(self, other: 'Vector2') -> float:
-        """Dot product with another vector."""
-        return self.x * other.x + self.y * other.y
-    
-    def distance_to(self, other: 'Vector2') -> float:
-        """Distance to another point."""
-        return (other - self).magnitude()
-    
-    def distance_squared_to(self, other: 'Vector2') -> float:
-        """Squared distance (faster for comparisons)."""
-        return (other - self).magnitude_squared()
-    
     def lerp(self, target: 'Vector2', t: float) -> 'Vector2':
         """Linear interpolation toward target."""
-        t = clamp(t, 0, 1)
-        return Vector2(
-            self.x + (target.x - self.x) * t,
-            self.y + (target.y - self.y) * t
-        )
+        return _PV2.lerp(self, target, clamp(t, 0, 1))
     
     def angle_to(self, other: 'Vector2') -> float:
         """Angle to another vector in radians."""
@@ -126,12 +124,7 @@ class Vector2:
     
     def rotated(self, angle: float) -> 'Vector2':
         """Return this vector rotated by angle (radians)."""
-        cos_a = math.cos(angle)
-        sin_a = math.sin(angle)
-        return Vector2(
-            self.x * cos_a - self.y * sin_a,
-            self.x * sin_a + self.y * cos_a
-        )
+        return self.rotate_rad(angle)
     
     @staticmethod
     def from_angle(angle: float, magnitude: float = 1.0) -> 'Vector2':
@@ -164,7 +157,10 @@ def clamp(value: float, min_val: float, max_val: float) -> float:
     Returns:
         The clamped value
     """
-    return max(min_val, min(value, max_val))
+    # Conditional expressions instead of max(min(...)): no builtin calls,
+    # and the same result as before (including min_val > max_val -> min_val)
+    value = max_val if value > max_val else value
+    return min_val if value < min_val else value
 
 
 def lerp(start: float, end: float, t: float) -> float:
@@ -252,11 +248,7 @@ def ease_in_out_quad(t: float) -> float:
 
 def sign(value: float) -> int:
     """Get the sign of a value (-1, 0, or 1)."""
-    if value > 0:
-        return 1
-    elif value < 0:
-        return -1
-    return 0
+    return (value > 0) - (value < 0)
 
 
 def approach(current: float, target: float, delta: float) -> float:
@@ -279,11 +271,8 @@ def approach(current: float, target: float, delta: float) -> float:
 
 def wrap_angle(angle: float) -> float:
     """Wrap angle to [-pi, pi] range."""
-    while angle > math.pi:
-        angle -= 2 * math.pi
-    while angle < -math.pi:
-        angle += 2 * math.pi
-    return angle
+    # IEEE remainder: constant time however many turns the angle holds
+    return math.remainder(angle, math.tau)
 
 
 def rect_center(x: float, y: float, width: float, height: float) -> Tuple[float, float]:
@@ -324,8 +313,8 @@ def format_time(seconds: float, show_decimals: bool = True) -> str:
     Returns:
         Formatted string like "1:23.45" or "1:23"
     """
-    minutes = int(seconds // 60)
-    secs = seconds % 60
+    minutes, secs = divmod(seconds, 60)
+    minutes = int(minutes)
     
     if show_decimals:
         return f"{minutes}:{secs:05.2f}"
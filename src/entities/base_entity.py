@@ -14,6 +14,7 @@ Design Philosophy:
 from typing import List, Tuple, TYPE_CHECKING
 from abc import ABC, abstractmethod
 import pygame
+import random
 import uuid
 
 from ..core.settings import Settings, COLORS
@@ -57,6 +58,11 @@ class BaseEntity(ABC):
         self.velocity = Vector2.zero()
         self.size = size
         
+        # Half extents, read by every center computation; size never
+        # changes after construction, so they are derived once here
+        self._half_w = size[0] / 2
+        self._half_h = size[1] / 2
+        
         # State
         self.active = True  # Whether entity updates and renders
         self.visible = True  # Whether entity renders (can be inactive but visible)
@@ -82,15 +88,15 @@ class BaseEntity(ABC):
     def center(self) -> Vector2:
         """Get entity center position."""
         return Vector2(
-            self.position.x + self.size[0] / 2,
-            self.position.y + self.size[1] / 2
+            self.position.x + self._half_w,
+            self.position.y + self._half_h
         )
     
     @center.setter
     def center(self, value: Vector2) -> None:
         """Set position based on center."""
-        self.position.x = value.x - self.size[0] / 2
-        self.position.y = value.y - self.size[1] / 2
+        self.position.x = value.x - self._half_w
+        self.position.y = value.y - self._half_h
     
     def get_rect(self) -> pygame.Rect:
         """
@@ -145,22 +151,24 @@ class BaseEntity(ABC):
         Override for complex behaviors.
         """
         predictions = []
-        current_pos = self.position.copy()
-        current_vel = self.velocity.copy()
+        px, py = self.position.x, self.position.y
+        vx, vy = self.velocity.x, self.velocity.y
+        
+        # Noise based on accuracy
+        noise = 10 * (1 - accuracy) if accuracy < 1.0 else 0.0
+        uniform = random.uniform
         
         t = interval
         while t <= duration:
             # Simple linear prediction
-            predicted_pos = current_pos + current_vel * t
+            x = px + vx * t
+            y = py + vy * t
             
-            # Add noise based on accuracy
-            if accuracy < 1.0:
-                import random
-                noise = 10 * (1 - accuracy)
-                predicted_pos.x += random.uniform(-noise, noise)
-                predicted_pos.y += random.uniform(-noise, noise)
+            if noise:
+                x += uniform(-noise, noise)
+                y += uniform(-noise, noise)
             
-            predictions.append((predicted_pos, t))
+            predictions.append((Vector2(x, y), t))
             t += interval
         
         return predictions
@@ -215,3 +223,50 @@ class BaseEntity(ABC):
     
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(id={self.id}, pos={self.position})"
+
+
+class StaticEntity(BaseEntity):
+    """
+    Base class for entities that never move once placed.
+    
+    The collision rect built by BaseEntity.__init__ is returned as-is
+    instead of being re-synced from the position on every query.
+    """
+    
+    def get_rect(self) -> pygame.Rect:
+        """Get the fixed collision rectangle."""
+        return self._rect
+
+
+class EntityPool:
+    """
+    Free list of released entities, for types that spawn and die often.
+    
+    Pooled classes provide reset(*args), taking the same arguments as
+    their constructor, to re-arm an instance that was released.
+    """
+    
+    def __init__(self, entity_class: type, max_size: int = 32):
+        """
+        Initialize an empty pool.
+        
+        Args:
+            entity_class: Class constructed when the pool is empty
+            max_size: Most released instances kept for reuse
+        """
+        self._entity_class = entity_class
+        self._max_size = max_size
+        self._free: List[BaseEntity] = []
+    
+    def acquire(self, *args) -> BaseEntity:
+        """Reuse a released entity if one is free, else construct one."""
+        if self._free:
+            entity = self._free.pop()
+            entity.reset(*args)
+            return entity
+        return self._entity_class(*args)
+    
+    def release(self, entity: BaseEntity) -> None:
+        """Return an entity that has left play to the pool."""
+        if len(self._free) < self._max_size:
+            self._free.append(entity)
@@ -15,6 +15,7 @@ Design Philosophy:
 from typing import List, Tuple, Optional, TYPE_CHECKING
 import pygame
 import math
+import uuid
 
 from .base_entity import BaseEntity
 from ..core.settings import Settings, COLORS
@@ -25,6 +26,89 @@ if TYPE_CHECKING:
     from ..entities.player import Player
 
 
+# Render colors, resolved once at import instead of per draw call
+_COLOR_WHITE = COLORS.WHITE
+_COLOR_BLACK = COLORS.BLACK
+_COLOR_GRAY = COLORS.GRAY
+_SHADOW_EYE = getattr(COLORS, 'SHADOW_EYE', (200, 0, 50))
+
+# Render target bounds for off-screen culling (there is no camera)
+_SCREEN_W = Settings.SCREEN_WIDTH
+_SCREEN_H = Settings.SCREEN_HEIGHT
+
+# Unit hexagon vertices (pointy-top) for DebtLeech
+_HEX_UNIT = tuple((math.cos(math.pi / 3 * i - math.pi / 6),
+                   math.sin(math.pi / 3 * i - math.pi / 6)) for i in range(6))
+
+# Outlined enemy bodies keyed by (size, fill, outline, glow), built on
+# first use so each frame blits one surface instead of issuing draw calls
+_body_cache: dict = {}
+
+
+def _get_body_surface(size: Tuple[int, int], fill: Tuple[int, int, int],
+                      outline: Tuple[int, int, int],
+                      glow: Optional[Tuple[int, int, int]] = None) -> pygame.Surface:
+    """
+    Get a cached body surface: a filled rect with a 2 px outline.
+    
+    With a glow color the surface gains a 3 px translucent border
+    around the body, so it must be blitted 3 px up and left.
+    """
+    key = (size, fill, outline, glow)
+    surf = _body_cache.get(key)
+    if surf is None:
+        pad = 3 if glow else 0
+        surf = pygame.Surface((size[0] + pad * 2, size[1] + pad * 2), pygame.SRCALPHA)
+        if glow:
+            surf.fill((*glow, 100))
+        body = pygame.Rect(pad, pad, size[0], size[1])
+        pygame.draw.rect(surf, fill, body)
+        pygame.draw.rect(surf, outline, body, 2)
+        surf = surf.convert_alpha() if glow else surf.convert()
+        _body_cache[key] = surf
+    return surf
+
+
+def _off_screen(rect: pygame.Rect, margin: int = 0) -> bool:
+    """True if rect, grown by margin on every side, misses the screen."""
+    return (rect.right + margin <= 0 or rect.bottom + margin <= 0
+            or rect.left - margin >= _SCREEN_W or rect.top - margin >= _SCREEN_H)
+
+
+def _vertex_offsets(cx: float, cy: float, offsets) -> Tuple[Tuple[int, int], ...]:
+    """
+    Integer polygon vertices relative to int(cx), int(cy).
+    
+    Vertices are truncated from float coordinates, so their offsets from
+    the truncated center shift by a pixel with the sub-pixel position.
+    The result keys pre-rendered sprites so they match per-frame drawing.
+    """
+    ix = int(cx)
+    iy = int(cy)
+    return tuple((int(cx + ox) - ix, int(cy + oy) - iy) for ox, oy in offsets)
+
+
+def _chase_step(entity: BaseEntity, dx: float, dy: float, distance: float,
+                speed: float, dt: float) -> None:
+    """
+    Move an entity at speed along (dx, dy), updating its velocity.
+    
+    Shared by every chasing enemy. The caller passes the length of
+    (dx, dy), which it usually needs anyway for a range check; a zero
+    length stops the entity, as normalizing a zero Vector2 would.
+    """
+    if distance == 0:
+        entity.velocity.set(0.0, 0.0)
+        return
+    
+    scale = speed / distance
+    vx = dx * scale
+    vy = dy * scale
+    entity.velocity.set(vx, vy)
+    entity.position.x += vx * dt
+    entity.position.y += vy * dt
+
+
 
 class PatrolDrone(BaseEntity):
     """
@@ -71,6 +155,7 @@ class PatrolDrone(BaseEntity):
         # For seeker
         self.target: Optional['Player'] = None
         self.detection_range = Settings.SEEKER_RANGE
+        self.seeker_speed = Settings.SEEKER_SPEED
         self.can_see_player = False
         
         # Visual
@@ -83,6 +168,14 @@ class PatrolDrone(BaseEntity):
         
         # Animation
         self._rotation = 0.0
+        
+        # Movement routine for this drone type, resolved once instead of
+        # comparing drone_type strings every frame (None = stationary)
+        self._update_fn = {
+            'linear': self._update_linear,
+            'circular': self._update_circular,
+            'seeker': self._update_seeker,
+        }.get(drone_type)
     
     def update(self, dt: float) -> None:
         """
@@ -94,12 +187,8 @@ class PatrolDrone(BaseEntity):
         if dt == 0:  # Frozen in time
             return
         
-        if self.drone_type == 'linear':
-            self._update_linear(dt)
-        elif self.drone_type == 'circular':
-            self._update_circular(dt)
-        elif self.drone_type == 'seeker':
-            self._update_seeker(dt)
+        if self._update_fn is not None:
+            self._update_fn(dt)
         
         # Update rotation for visual effect
         self._rotation += dt * 2
@@ -109,11 +198,14 @@ class PatrolDrone(BaseEntity):
         if not self.patrol_points:
             return
         
+        # Plain float math, moving the position in place
         target = self.patrol_points[self.current_target_index]
-        direction = (target - self.center)
-        distance = direction.magnitude()
+        position = self.position
+        dx = target.x - (position.x + self._half_w)
+        dy = target.y - (position.y + self._half_h)
+        distance_sq = dx * dx + dy * dy
         
-        if distance < 5:  # Reached waypoint
+        if distance_sq < 25:  # Reached waypoint (within 5 px)
             # Move to next waypoint
             self.current_target_index += self.patrol_direction
             
@@ -125,27 +217,33 @@ class PatrolDrone(BaseEntity):
                 self.current_target_index = 1
                 self.patrol_direction = 1
         else:
-            # Move toward target
-            direction = direction.normalized()
-            self.velocity = direction * self.speed
-            self.position = self.position + self.velocity * dt
+            # Move toward target; the sqrt is only needed here
+            scale = self.speed / math.sqrt(distance_sq)
+            vx = dx * scale
+            vy = dy * scale
+            self.velocity.set(vx, vy)
+            position.x += vx * dt
+            position.y += vy * dt
     
     def _update_circular(self, dt: float) -> None:
         """Update circular patrol movement."""
         self.orbit_angle += self.orbit_speed * dt
         
-        # Calculate position on circle
-        self.position.x = self.orbit_center.x + math.cos(self.orbit_angle) * self.orbit_radius - self.size[0] / 2
-        self.position.y = self.orbit_center.y + math.sin(self.orbit_angle) * self.orbit_radius - self.size[1] / 2
+        # Calculate center on circle. math.cos/sin are single C calls;
+        # a Python-level sin/cos lookup table measured slower than them.
+        ocx = self.orbit_center.x
+        ocy = self.orbit_center.y
+        radius = self.orbit_radius
+        cx = ocx + math.cos(self.orbit_angle) * radius
+        cy = ocy + math.sin(self.orbit_angle) * radius
+        self.position.x = cx - self._half_w
+        self.position.y = cy - self._half_h
         
         # Calculate velocity for predictions
         next_angle = self.orbit_angle + 0.1
-        next_x = self.orbit_center.x + math.cos(next_angle) * self.orbit_radius
-        next_y = self.orbit_center.y + math.sin(next_angle) * self.orbit_radius
-        
-        self.velocity = Vector2(
-            (next_x - self.center.x) * 10,
-            (next_y - self.center.y) * 10
+        self.velocity.set(
+            (ocx + math.cos(next_angle) * radius - cx) * 10,
+            (ocy + math.sin(next_angle) * radius - cy) * 10
         )
     
     def _update_seeker(self, dt: float) -> None:
@@ -154,14 +252,15 @@ class PatrolDrone(BaseEntity):
             return
         
         # Check if player is in range and visible
-        distance = self.center.distance_to(self.target.center)
+        target_center = self.target.center
+        dx = target_center.x - (self.position.x + self._half_w)
+        dy = target_center.y - (self.position.y + self._half_h)
+        distance = math.sqrt(dx * dx + dy * dy)
         self.can_see_player = distance <= self.detection_range
         
         if self.can_see_player:
             # Move toward player
-            direction = (self.target.center - self.center).normalized()
-            self.velocity = direction * Settings.SEEKER_SPEED
-            self.position = self.position + self.velocity * dt
+            _chase_step(self, dx, dy, distance, self.seeker_speed, dt)
         else:
             # Return to patrol
             self._update_linear(dt)
@@ -174,42 +273,55 @@ class PatrolDrone(BaseEntity):
                                 accuracy: float = 1.0) -> List[Tuple[Vector2, float]]:
         """Predict future positions based on patrol type."""
         predictions = []
+        half_w = self._half_w
+        half_h = self._half_h
         
         if self.drone_type == 'circular':
             # Predict circular motion
+            cos, sin = math.cos, math.sin
+            ocx = self.orbit_center.x - half_w
+            ocy = self.orbit_center.y - half_h
+            radius = self.orbit_radius
+            angle = self.orbit_angle
+            orbit_speed = self.orbit_speed
             t = interval
             while t <= duration:
-                future_angle = self.orbit_angle + self.orbit_speed * t
-                predicted_x = self.orbit_center.x + math.cos(future_angle) * self.orbit_radius - self.size[0] / 2
-                predicted_y = self.orbit_center.y + math.sin(future_angle) * self.orbit_radius - self.size[1] / 2
-                predictions.append((Vector2(predicted_x, predicted_y), t))
+                future_angle = angle + orbit_speed * t
+                predictions.append((Vector2(ocx + cos(future_angle) * radius,
+                                            ocy + sin(future_angle) * radius), t))
                 t += interval
         elif self.drone_type == 'linear':
-            # Simulate patrol
-            sim_pos = self.position.copy()
+            # Simulate patrol (on floats; one Vector2 per emitted sample)
+            points = self.patrol_points
+            last_index = len(points) - 1
+            sim_x = self.position.x
+            sim_y = self.position.y
             sim_target_idx = self.current_target_index
             sim_direction = self.patrol_direction
+            move_amount = self.speed * interval
             
             t = interval
-            while t <= duration and self.patrol_points:
+            while t <= duration and points:
                 # Simulate movement
-                target = self.patrol_points[sim_target_idx]
-                move_dir = (target - (sim_pos + Vector2(self.size[0]/2, self.size[1]/2)))
-                dist = move_dir.magnitude()
+                target = points[sim_target_idx]
+                dx = target.x - (sim_x + half_w)
+                dy = target.y - (sim_y + half_h)
+                dist = math.sqrt(dx * dx + dy * dy)
                 
-                move_amount = self.speed * interval
                 if dist < move_amount:
                     sim_target_idx += sim_direction
-                    if sim_target_idx >= len(self.patrol_points):
-                        sim_target_idx = len(self.patrol_points) - 2
+                    if sim_target_idx > last_index:
+                        sim_target_idx = last_index - 1
                         sim_direction = -1
                     elif sim_target_idx < 0:
                         sim_target_idx = 1
                         sim_direction = 1
                 else:
-                    sim_pos = sim_pos + move_dir.normalized() * move_amount
+                    scale = move_amount / dist
+                    sim_x += dx * scale
+                    sim_y += dy * scale
                 
-                predictions.append((sim_pos.copy(), t))
+                predictions.append((Vector2(sim_x, sim_y), t))
                 t += interval
         else:
             # Default linear prediction for seekers
@@ -223,25 +335,28 @@ class PatrolDrone(BaseEntity):
             return
         
         rect = self.get_rect()
-        center = self.center
+        show_range = self.drone_type == 'seeker' and Settings.DEBUG_MODE
+        if not show_range and _off_screen(rect):
+            return
+        
+        cx = self.position.x + self._half_w
+        cy = self.position.y + self._half_h
+        int_center = (int(cx), int(cy))
         
-        # Draw main body
-        pygame.draw.rect(screen, self.color, rect)
+        # Draw main body and outline
+        screen.blit(_get_body_surface(self.size, self.color, _COLOR_WHITE), rect)
         
         # Draw rotating indicator
         indicator_length = self.size[0] * 0.4
-        end_x = center.x + math.cos(self._rotation) * indicator_length
-        end_y = center.y + math.sin(self._rotation) * indicator_length
-        pygame.draw.line(screen, COLORS.WHITE,
-                        center.int_tuple, (int(end_x), int(end_y)), 2)
+        end_x = cx + math.cos(self._rotation) * indicator_length
+        end_y = cy + math.sin(self._rotation) * indicator_length
+        pygame.draw.line(screen, _COLOR_WHITE,
+                        int_center, (int(end_x), int(end_y)), 2)
         
         # Draw seeker range (if seeker and debug)
-        if self.drone_type == 'seeker' and Settings.DEBUG_MODE:
-            pygame.draw.circle(screen, (255, 0, 0), center.int_tuple,
+        if show_range:
+            pygame.draw.circle(screen, (255, 0, 0), int_center,
                              int(self.detection_range), 1)
-        
-        # Draw outline
-        pygame.draw.rect(screen, COLORS.WHITE, rect, 2)
 
 
 class TemporalHunter(BaseEntity):
@@ -299,23 +414,26 @@ class TemporalHunter(BaseEntity):
         
         if time_frozen and self.target:
             # Move toward player during freeze
-            direction = (self.target.center - self.center).normalized()
-            self.velocity = direction * self.speed
-            self.position = self.position + self.velocity * dt
+            target_center = self.target.center
+            dx = target_center.x - (self.position.x + self._half_w)
+            dy = target_center.y - (self.position.y + self._half_h)
+            _chase_step(self, dx, dy, math.sqrt(dx * dx + dy * dy), self.speed, dt)
             
-            # Eye tracks player
+            # Eye tracks player (from the center after this step's move)
+            position = self.position
             self._eye_offset = math.atan2(
-                self.target.center.y - self.center.y,
-                self.target.center.x - self.center.x
+                target_center.y - (position.y + self._half_h),
+                target_center.x - (position.x + self._half_w)
             )
         else:
             # Slowly return home when not frozen
-            if self.position.distance_to(self.home_position) > 5:
-                direction = (self.home_position - self.position).normalized()
-                self.velocity = direction * (self.speed * 0.3)
-                self.position = self.position + self.velocity * dt
+            dx = self.home_position.x - self.position.x
+            dy = self.home_position.y - self.position.y
+            distance = math.sqrt(dx * dx + dy * dy)
+            if distance > 5:
+                _chase_step(self, dx, dy, distance, self.speed * 0.3, dt)
             else:
-                self.velocity = Vector2.zero()
+                self.velocity.set(0.0, 0.0)
     
     def set_target(self, target: 'Player') -> None:
         """Set the hunt target."""
@@ -327,41 +445,27 @@ class TemporalHunter(BaseEntity):
             return
         
         rect = self.get_rect()
-        center = self.center
+        if _off_screen(rect, 3):
+            return
         
-        # Determine color based on active state
+        # Body and outline, with a glow border when active; dim when inactive
         if self.is_active:
-            color = self.color
-            # Add glow effect when active
-            glow_rect = pygame.Rect(
-                rect.x - 3, rect.y - 3,
-                rect.width + 6, rect.height + 6
-            )
-            glow_surf = pygame.Surface((glow_rect.width, glow_rect.height), pygame.SRCALPHA)
-            pygame.draw.rect(glow_surf, (*self.color, 100), 
-                           (0, 0, glow_rect.width, glow_rect.height))
-            screen.blit(glow_surf, glow_rect.topleft)
+            screen.blit(_get_body_surface(self.size, self.color, _COLOR_WHITE, self.color),
+                        (rect.x - 3, rect.y - 3))
         else:
-            # Dim when inactive
             color = (
                 self.color[0] // 2,
                 self.color[1] // 2,
                 self.color[2] // 2
             )
-        
-        # Draw body
-        pygame.draw.rect(screen, color, rect)
+            screen.blit(_get_body_surface(self.size, color, _COLOR_GRAY), rect)
         
         # Draw "eye"
         eye_radius = 8
-        eye_x = center.x + math.cos(self._eye_offset) * 10
-        eye_y = center.y + math.sin(self._eye_offset) * 10
-        pygame.draw.circle(screen, COLORS.WHITE, (int(eye_x), int(eye_y)), eye_radius)
-        pygame.draw.circle(screen, COLORS.BLACK, (int(eye_x), int(eye_y)), eye_radius // 2)
-        
-        # Draw outline
-        outline_color = COLORS.WHITE if self.is_active else COLORS.GRAY
-        pygame.draw.rect(screen, outline_color, rect, 2)
+        eye = (int(self.position.x + self._half_w + math.cos(self._eye_offset) * 10),
+               int(self.position.y + self._half_h + math.sin(self._eye_offset) * 10))
+        pygame.draw.circle(screen, _COLOR_WHITE, eye, eye_radius)
+        pygame.draw.circle(screen, _COLOR_BLACK, eye, eye_radius // 2)
 
 
 class DebtShadow(BaseEntity):
@@ -376,6 +480,10 @@ class DebtShadow(BaseEntity):
     accumulates - exactly the experience we want.
     """
     
+    # Rendered layer surfaces keyed by integer geometry and color,
+    # shared by every shadow
+    _layer_cache: dict = {}
+    
     def __init__(self, position: Vector2, target: 'Player'):
         """
         Initialize a debt shadow.
@@ -408,6 +516,29 @@ class DebtShadow(BaseEntity):
         # Shadows move during time freeze too (unstoppable debt!)
         self.affected_by_time = False
     
+    def reset(self, position: Vector2, target: 'Player') -> None:
+        """
+        Re-arm a released shadow for a new spawn (see EntityPool).
+        
+        Args:
+            position: Spawn position
+            target: Player to chase
+        """
+        # A new identity, so id-keyed state (rewind snapshots, echoes)
+        # recorded for the destroyed shadow never matches this one
+        self.id = str(uuid.uuid4())[:8]
+        self.position = position.copy()
+        self.velocity = Vector2.zero()
+        self.active = True
+        self.visible = True
+        
+        self.target = target
+        self.spawn_threshold = Settings.SHADOW_SPAWN_DEBT
+        self.is_dissolving = False
+        self.dissolve_timer = 0.0
+        self.alpha = 200
+        self._wobble_timer = 0.0
+    
     def update(self, dt: float, current_debt: float = 0) -> None:
         """
         Update shadow state.
@@ -429,14 +560,15 @@ class DebtShadow(BaseEntity):
         
         # Chase player
         if self.target and not self.target.is_dead:
-            direction = (self.target.center - self.center).normalized()
+            target_center = self.target.center
+            dx = target_center.x - (self.position.x + self._half_w)
+            dy = target_center.y - (self.position.y + self._half_h)
             
             # Speed increases with debt
             debt_factor = 1 + (current_debt / 20)
             actual_speed = self.speed * debt_factor
             
-            self.velocity = direction * actual_speed
-            self.position = self.position + self.velocity * dt
+            _chase_step(self, dx, dy, math.sqrt(dx * dx + dy * dy), actual_speed, dt)
         
         # Wobble animation
         self._wobble_timer += dt * 3
@@ -446,39 +578,53 @@ class DebtShadow(BaseEntity):
         self.is_dissolving = True
         self.dissolve_timer = 0.0
     
-    def render(self, screen: pygame.Surface) -> None:
-        """Render the debt shadow."""
-        if not self.visible:
-            return
-        
-        rect = self.get_rect()
-        center = self.center
-        
-        # Create surface with alpha
+    def _build_layers(self, wobble: float) -> pygame.Surface:
+        """Rasterize the layered shadow body for one wobble offset."""
         shadow_surf = pygame.Surface((self.size[0] + 20, self.size[1] + 20), pygame.SRCALPHA)
         
-        # Wobble effect
-        wobble = math.sin(self._wobble_timer) * 3
-        
         # Draw multiple layers for ethereal effect
         for i in range(3):
             offset = i * 3 + wobble
-            layer_alpha = self.alpha // (i + 1)
+            layer_alpha = 255 // (i + 1)
             layer_rect = pygame.Rect(
                 int(10 - offset), int(10 - offset),
                 int(self.size[0] + offset * 2), int(self.size[1] + offset * 2)
             )
             pygame.draw.rect(shadow_surf, (*self.color, layer_alpha), layer_rect)
         
+        return shadow_surf.convert_alpha()
+    
+    def render(self, screen: pygame.Surface) -> None:
+        """Render the debt shadow."""
+        if not self.visible:
+            return
+        
+        rect = self.get_rect()
+        if _off_screen(rect, 10):
+            return
+        
+        # Wobble effect; the layers only ever take a handful of integer
+        # sizes, so each one is rasterized once and reused
+        wobble = math.sin(self._wobble_timer) * 3
+        key = (int(10 - wobble),
+               int(self.size[0] + wobble * 2),
+               int(self.size[1] + wobble * 2),
+               self.color)
+        shadow_surf = DebtShadow._layer_cache.get(key)
+        if shadow_surf is None:
+            shadow_surf = self._build_layers(wobble)
+            DebtShadow._layer_cache[key] = shadow_surf
+        
+        # Layers are cached at full strength; fade them as a whole
+        shadow_surf.set_alpha(self.alpha)
         screen.blit(shadow_surf, (int(rect.x - 10), int(rect.y - 10)))
         
         # Draw menacing eyes
         if not self.is_dissolving:
-            eye_y = center.y - 5
-            pygame.draw.circle(screen, getattr(COLORS, 'SHADOW_EYE', (200, 0, 50)), 
-                             (int(center.x - 10), int(eye_y)), 5)
-            pygame.draw.circle(screen, getattr(COLORS, 'SHADOW_EYE', (200, 0, 50)),
-                             (int(center.x + 10), int(eye_y)), 5)
+            cx = self.position.x + self._half_w
+            eye_y = int(self.position.y + self._half_h - 5)
+            pygame.draw.circle(screen, _SHADOW_EYE, (int(cx - 10), eye_y), 5)
+            pygame.draw.circle(screen, _SHADOW_EYE, (int(cx + 10), eye_y), 5)
 
 
 # =====================================================================
@@ -493,6 +639,13 @@ class PhaseShifter(BaseEntity):
     Psychological trick: appears where you *were* heading.
     """
     
+    # Scratch surface for the teleport ring, shared by all shifters
+    _ring_surf: Optional[pygame.Surface] = None
+    
+    # Pre-rendered diamond sprites and glow variants
+    _sprite_cache: dict = {}
+    _glow_cache: dict = {}
+    
     def __init__(self, position: Vector2, speed: float = None):
         super().__init__(position, (38, 38))
         self.speed = speed or Settings.PHASE_SHIFTER_SPEED
@@ -501,6 +654,9 @@ class PhaseShifter(BaseEntity):
         self.teleport_cooldown = Settings.PHASE_SHIFTER_TELEPORT_COOLDOWN
         self._teleport_timer = self.teleport_cooldown * 0.5
         self._teleport_range = Settings.PHASE_SHIFTER_TELEPORT_RANGE
+        # Teleport destinations keep the whole body on screen
+        self._max_x = Settings.SCREEN_WIDTH - self.size[0]
+        self._max_y = Settings.SCREEN_HEIGHT - self.size[1]
         self._is_phasing = False
         self._phase_timer = 0.0
         self._phase_duration = 0.4
@@ -513,8 +669,14 @@ class PhaseShifter(BaseEntity):
         
         self._anim_timer = 0.0
         self._ring_alpha = 0
+        
+        # Diamond vertices relative to the center
+        hw = self.size[0] // 2
+        hh = self.size[1] // 2
+        self._shape_offsets = ((0, -hh), (hw, 0), (0, hh), (-hw, 0))
+        self._sprite_margin = max(hw, hh) + 4
         import random as _rng
-        self._rng = _rng
+        self._rand = _rng.random
 
     def set_target(self, target: 'Player') -> None:
         self.target = target
@@ -533,11 +695,12 @@ class PhaseShifter(BaseEntity):
             return
         
         if self.target and not self.target.is_dead:
-            direction = (self.target.center - self.center)
-            if direction.magnitude() > 10:
-                direction = direction.normalized()
-                self.velocity = direction * self.speed
-                self.position = self.position + self.velocity * dt
+            target_center = self.target.center
+            dx = target_center.x - (self.position.x + self._half_w)
+            dy = target_center.y - (self.position.y + self._half_h)
+            distance_sq = dx * dx + dy * dy
+            if distance_sq > 100:
+                _chase_step(self, dx, dy, math.sqrt(distance_sq), self.speed, dt)
         
         self._teleport_timer += dt
         if self._teleport_timer >= self.teleport_cooldown and self.target:
@@ -552,48 +715,70 @@ class PhaseShifter(BaseEntity):
         self._phase_timer = 0.0
         self._ring_alpha = 200
         
-        angle = self._rng.uniform(0, math.pi * 2)
-        dist = self._rng.uniform(80, self._teleport_range)
-        new_x = self.target.center.x + math.cos(angle) * dist - self.size[0] / 2
-        new_y = self.target.center.y + math.sin(angle) * dist - self.size[1] / 2
-        new_x = max(0, min(Settings.SCREEN_WIDTH - self.size[0], new_x))
-        new_y = max(0, min(Settings.SCREEN_HEIGHT - self.size[1], new_y))
+        # Same draws as uniform(0, 2pi) and uniform(80, range), inlined
+        rand = self._rand
+        angle = rand() * (math.pi * 2)
+        dist = 80 + (self._teleport_range - 80) * rand()
+        target_center = self.target.center
+        new_x = target_center.x + math.cos(angle) * dist - self._half_w
+        new_y = target_center.y + math.sin(angle) * dist - self._half_h
+        new_x = max(0, min(self._max_x, new_x))
+        new_y = max(0, min(self._max_y, new_y))
         self.position = Vector2(new_x, new_y)
 
     def render(self, screen: pygame.Surface) -> None:
         if not self.visible:
             return
         rect = self.get_rect()
-        center = self.center
         
         if self._is_phasing:
             if self._ring_alpha > 0:
-                ring_surf = pygame.Surface((80, 80), pygame.SRCALPHA)
+                ring_surf = PhaseShifter._ring_surf
+                if ring_surf is None:
+                    ring_surf = pygame.Surface((80, 80), pygame.SRCALPHA)
+                    PhaseShifter._ring_surf = ring_surf
+                ring_surf.fill((0, 0, 0, 0))
                 pygame.draw.circle(ring_surf, (*self.color, min(255, self._ring_alpha)),
                                  (40, 40), 35, 3)
                 screen.blit(ring_surf, (int(self._old_pos.x + self.size[0]//2 - 40),
                                        int(self._old_pos.y + self.size[1]//2 - 40)))
             return
         
-        glow_surf = pygame.Surface((rect.width + 16, rect.height + 16), pygame.SRCALPHA)
+        if _off_screen(rect, 8):
+            return
+        
         pulse = (math.sin(self._anim_timer * 5) + 1) / 2
         glow_alpha = int(40 + 30 * pulse)
-        pygame.draw.rect(glow_surf, (*self.color, glow_alpha),
-                        (0, 0, rect.width + 16, rect.height + 16), border_radius=8)
+        glow_surf = self._glow_cache.get((self.size, self.color, glow_alpha))
+        if glow_surf is None:
+            glow_surf = pygame.Surface((rect.width + 16, rect.height + 16), pygame.SRCALPHA)
+            pygame.draw.rect(glow_surf, (*self.color, glow_alpha),
+                            (0, 0, rect.width + 16, rect.height + 16), border_radius=8)
+            glow_surf = glow_surf.convert_alpha()
+            self._glow_cache[(self.size, self.color, glow_alpha)] = glow_surf
         screen.blit(glow_surf, (rect.x - 8, rect.y - 8))
         
-        points = [
-            (center.x, center.y - self.size[1]//2),
-            (center.x + self.size[0]//2, center.y),
-            (center.x, center.y + self.size[1]//2),
-            (center.x - self.size[0]//2, center.y),
-        ]
-        int_points = [(int(p[0]), int(p[1])) for p in points]
-        pygame.draw.polygon(screen, self.color, int_points)
-        pygame.draw.polygon(screen, COLORS.WHITE, int_points, 2)
-        
-        pygame.draw.circle(screen, COLORS.WHITE, (int(center.x), int(center.y)), 6)
-        pygame.draw.circle(screen, self.color, (int(center.x), int(center.y)), 3)
+        cx = self.position.x + self._half_w
+        cy = self.position.y + self._half_h
+        shape = _vertex_offsets(cx, cy, self._shape_offsets)
+        margin = self._sprite_margin
+        screen.blit(self._get_sprite(shape, margin),
+                    (int(cx) - margin, int(cy) - margin))
+    
+    def _get_sprite(self, shape: Tuple[Tuple[int, int], ...], margin: int) -> pygame.Surface:
+        """Get the cached diamond body, outline and core for a vertex layout."""
+        key = (shape, self.color)
+        sprite = self._sprite_cache.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((margin * 2 + 1, margin * 2 + 1), pygame.SRCALPHA)
+            points = [(margin + dx, margin + dy) for dx, dy in shape]
+            pygame.draw.polygon(sprite, self.color, points)
+            pygame.draw.polygon(sprite, _COLOR_WHITE, points, 2)
+            pygame.draw.circle(sprite, _COLOR_WHITE, (margin, margin), 6)
+            pygame.draw.circle(sprite, self.color, (margin, margin), 3)
+            sprite = sprite.convert_alpha()
+            self._sprite_cache[key] = sprite
+        return sprite
 
 
 class DebtLeech(BaseEntity):
@@ -602,12 +787,20 @@ class DebtLeech(BaseEntity):
     Forces awareness of proximity danger.
     """
     
+    # Screen-sized scratch surface for the drain beam, shared by all leeches
+    _beam_surf: Optional[pygame.Surface] = None
+    
+    # Pre-rendered hexagon sprites and drain glow variants
+    _sprite_cache: dict = {}
+    _glow_cache: dict = {}
+    
     def __init__(self, position: Vector2, speed: float = None):
         super().__init__(position, (36, 36))
         self.speed = speed or Settings.DEBT_LEECH_SPEED
         self.target: Optional['Player'] = None
         
         self.drain_range = Settings.DEBT_LEECH_RANGE
+        self._drain_range_sq = self.drain_range * self.drain_range
         self.drain_rate = Settings.DEBT_LEECH_DRAIN_RATE
         self.is_draining = False
         
@@ -618,6 +811,11 @@ class DebtLeech(BaseEntity):
         
         self._pulse_timer = 0.0
         self._drain_beam_alpha = 0
+        
+        # Hexagon vertices relative to the center
+        r = self.size[0] // 2
+        self._shape_offsets = tuple((r * ux, r * uy) for ux, uy in _HEX_UNIT)
+        self._sprite_margin = r + 4
 
     def set_target(self, target: 'Player') -> None:
         self.target = target
@@ -628,57 +826,83 @@ class DebtLeech(BaseEntity):
         self._pulse_timer += dt * 3
         
         if self.target and not self.target.is_dead:
-            distance = self.center.distance_to(self.target.center)
-            self.is_draining = distance <= self.drain_range
+            target_center = self.target.center
+            dx = target_center.x - (self.position.x + self._half_w)
+            dy = target_center.y - (self.position.y + self._half_h)
+            distance_sq = dx * dx + dy * dy
+            self.is_draining = distance_sq <= self._drain_range_sq
             
-            direction = (self.target.center - self.center)
-            if direction.magnitude() > 10:
-                direction = direction.normalized()
-                self.velocity = direction * self.speed
-                self.position = self.position + self.velocity * dt
+            if distance_sq > 100:
+                _chase_step(self, dx, dy, math.sqrt(distance_sq), self.speed, dt)
             
             if self.is_draining and debt_manager:
                 debt_manager.accrue_debt(self.drain_rate * dt)
-                self._drain_beam_alpha = min(180, self._drain_beam_alpha + int(dt * 400))
+                self._drain_beam_alpha = min(180, self._drain_beam_alpha + dt * 400)
             else:
-                self._drain_beam_alpha = max(0, self._drain_beam_alpha - int(dt * 300))
+                self._drain_beam_alpha = max(0, self._drain_beam_alpha - dt * 300)
         else:
             self.is_draining = False
-            self._drain_beam_alpha = max(0, self._drain_beam_alpha - int(dt * 300))
+            self._drain_beam_alpha = max(0, self._drain_beam_alpha - dt * 300)
 
     def render(self, screen: pygame.Surface) -> None:
         if not self.visible:
             return
         rect = self.get_rect()
-        center = self.center
+        cx = self.position.x + self._half_w
+        cy = self.position.y + self._half_h
         
         if self._drain_beam_alpha > 0 and self.target:
-            beam_surf = pygame.Surface((Settings.SCREEN_WIDTH, Settings.SCREEN_HEIGHT), pygame.SRCALPHA)
-            pygame.draw.line(beam_surf, (*self.color, self._drain_beam_alpha),
-                           (int(center.x), int(center.y)),
-                           (int(self.target.center.x), int(self.target.center.y)), 3)
-            screen.blit(beam_surf, (0, 0))
+            beam_surf = DebtLeech._beam_surf
+            if beam_surf is None:
+                beam_surf = pygame.Surface((Settings.SCREEN_WIDTH, Settings.SCREEN_HEIGHT), pygame.SRCALPHA)
+                DebtLeech._beam_surf = beam_surf
+            
+            # Only the line's bounding box is cleared, drawn and blitted
+            x1, y1 = int(cx), int(cy)
+            target_center = self.target.center
+            x2, y2 = int(target_center.x), int(target_center.y)
+            bbox = pygame.Rect(min(x1, x2) - 3, min(y1, y2) - 3,
+                               abs(x2 - x1) + 7, abs(y2 - y1) + 7).clip(beam_surf.get_rect())
+            beam_surf.fill((0, 0, 0, 0), bbox)
+            pygame.draw.line(beam_surf, (*self.color, int(self._drain_beam_alpha)),
+                           (x1, y1), (x2, y2), 3)
+            screen.blit(beam_surf, bbox, bbox)
+        
+        # The beam can cross the screen from off-screen; the body cannot
+        if _off_screen(rect, 10):
+            return
         
         pulse = (math.sin(self._pulse_timer) + 1) / 2
         if self.is_draining:
-            glow_surf = pygame.Surface((rect.width + 20, rect.height + 20), pygame.SRCALPHA)
             glow_alpha = int(50 + 60 * pulse)
-            pygame.draw.circle(glow_surf, (*self.color, glow_alpha),
-                             (rect.width//2 + 10, rect.height//2 + 10), rect.width//2 + 8)
+            glow_surf = self._glow_cache.get((self.size, self.color, glow_alpha))
+            if glow_surf is None:
+                glow_surf = pygame.Surface((rect.width + 20, rect.height + 20), pygame.SRCALPHA)
+                pygame.draw.circle(glow_surf, (*self.color, glow_alpha),
+                                 (rect.width//2 + 10, rect.height//2 + 10), rect.width//2 + 8)
+                glow_surf = glow_surf.convert_alpha()
+                self._glow_cache[(self.size, self.color, glow_alpha)] = glow_surf
             screen.blit(glow_surf, (rect.x - 10, rect.y - 10))
         
-        r = self.size[0] // 2
-        hex_points = []
-        for i in range(6):
-            angle = math.pi / 3 * i - math.pi / 6
-            hx = center.x + r * math.cos(angle)
-            hy = center.y + r * math.sin(angle)
-            hex_points.append((int(hx), int(hy)))
-        
-        pygame.draw.polygon(screen, self.color, hex_points)
-        pygame.draw.polygon(screen, (255, 255, 200), hex_points, 2)
-        pygame.draw.circle(screen, (40, 40, 0), (int(center.x), int(center.y)), 7)
-        pygame.draw.circle(screen, self.color, (int(center.x), int(center.y)), 4)
+        shape = _vertex_offsets(cx, cy, self._shape_offsets)
+        margin = self._sprite_margin
+        screen.blit(self._get_sprite(shape, margin),
+                    (int(cx) - margin, int(cy) - margin))
+    
+    def _get_sprite(self, shape: Tuple[Tuple[int, int], ...], margin: int) -> pygame.Surface:
+        """Get the cached hexagon body, outline and core for a vertex layout."""
+        key = (shape, self.color)
+        sprite = self._sprite_cache.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((margin * 2 + 1, margin * 2 + 1), pygame.SRCALPHA)
+            points = [(margin + dx, margin + dy) for dx, dy in shape]
+            pygame.draw.polygon(sprite, self.color, points)
+            pygame.draw.polygon(sprite, (255, 255, 200), points, 2)
+            pygame.draw.circle(sprite, (40, 40, 0), (margin, margin), 7)
+            pygame.draw.circle(sprite, self.color, (margin, margin), 4)
+            sprite = sprite.convert_alpha()
+            self._sprite_cache[key] = sprite
+        return sprite
 
 
 class SwarmDrone(BaseEntity):
@@ -686,6 +910,10 @@ class SwarmDrone(BaseEntity):
     Tiny, fast drones that spawn in groups. Short-lived but terrifying.
     """
     
+    # Fully opaque sprites keyed by (size, color); the fade is applied as
+    # surface alpha at blit time, so only a few sizes are ever cached
+    _sprite_cache: dict = {}
+    
     def __init__(self, position: Vector2, target: Optional['Player'] = None,
                  lifetime: float = None):
         size = Settings.SWARM_DRONE_SIZE
@@ -716,23 +944,36 @@ class SwarmDrone(BaseEntity):
             return
         
         if self.target and not self.target.is_dead:
-            direction = (self.target.center - self.center)
-            if direction.magnitude() > 5:
-                direction = direction.normalized()
-                perp = Vector2(-direction.y, direction.x)
+            target_center = self.target.center
+            dx = target_center.x - (self.position.x + self._half_w)
+            dy = target_center.y - (self.position.y + self._half_h)
+            distance_sq = dx * dx + dy * dy
+            if distance_sq > 25:
+                # Unit direction plus a sideways wobble along its perpendicular
+                inv = 1.0 / math.sqrt(distance_sq)
+                ux = dx * inv
+                uy = dy * inv
                 wobble_mag = math.sin(self._wobble + self._wobble_offset) * 40
-                final_dir = direction * self.speed + perp * wobble_mag
-                self.position = self.position + final_dir * dt
+                self.position.x += (ux * self.speed - uy * wobble_mag) * dt
+                self.position.y += (uy * self.speed + ux * wobble_mag) * dt
 
     def render(self, screen: pygame.Surface) -> None:
         if not self.visible or not self.active:
             return
-        center = self.center
+        if _off_screen(self.get_rect(), self.size[0]):
+            return
         life_pct = max(0.01, 1.0 - (self._age / self.lifetime))
         alpha = int(220 * life_pct)
         sz = int(self.size[0] * (0.6 + 0.4 * life_pct))
         
-        surf = pygame.Surface((sz * 2, sz * 2), pygame.SRCALPHA)
-        pygame.draw.circle(surf, (*self.color, alpha), (sz, sz), sz)
-        pygame.draw.circle(surf, (255, 255, 255, alpha // 2), (sz, sz), sz, 1)
-        screen.blit(surf, (int(center.x - sz), int(center.y - sz)))
+        key = (sz, self.color)
+        surf = SwarmDrone._sprite_cache.get(key)
+        if surf is None:
+            surf = pygame.Surface((sz * 2, sz * 2), pygame.SRCALPHA)
+            pygame.draw.circle(surf, self.color, (sz, sz), sz)
+            pygame.draw.circle(surf, (255, 255, 255, 128), (sz, sz), sz, 1)
+            surf = surf.convert_alpha()
+            SwarmDrone._sprite_cache[key] = surf
+        surf.set_alpha(alpha)
+        screen.blit(surf, (int(self.position.x + self._half_w - sz),
+                           int(self.position.y + self._half_h - sz)))
@@ -17,7 +17,7 @@ from typing import Optional, TYPE_CHECKING
 import pygame
 import math
 
-from .base_entity import BaseEntity
+from .base_entity import StaticEntity
 from ..core.settings import Settings, COLORS
 from ..core.utils import Vector2
 from ..core.events import GameEvent, get_event_manager
@@ -28,7 +28,7 @@ if TYPE_CHECKING:
 
 
 
-class DebtSink(BaseEntity):
+class DebtSink(StaticEntity):
     """
     A crystal that absorbs temporal debt.
     
@@ -67,6 +67,7 @@ class DebtSink(BaseEntity):
         # Visual
         self.color = COLORS.DEBT_SINK
         self._pulse_timer = 0.0
+        self._glow_surf = pygame.Surface((self.size[0] + 40, self.size[1] + 40), pygame.SRCALPHA)
         
         # Collision
         self.collision_layer = CollisionLayer.TRIGGER
@@ -139,7 +140,8 @@ class DebtSink(BaseEntity):
             glow_size = 10 * pulse
             
             # Glow effect
-            glow_surf = pygame.Surface((self.size[0] + 40, self.size[1] + 40), pygame.SRCALPHA)
+            glow_surf = self._glow_surf
+            glow_surf.fill((0, 0, 0, 0))
             glow_color = (*self.color, int(50 + 50 * pulse))
             pygame.draw.circle(glow_surf, glow_color,
                              (self.size[0] // 2 + 20, self.size[1] // 2 + 20),
@@ -161,7 +163,7 @@ class DebtSink(BaseEntity):
                 pygame.draw.circle(screen, COLORS.WHITE, (int(dot_x), int(rect.bottom + 8)), 3)
 
 
-class DebtMirror(BaseEntity):
+class DebtMirror(StaticEntity):
     """
     A mirror that can reflect temporal debt.
     
@@ -275,7 +277,7 @@ class DebtMirror(BaseEntity):
             pygame.draw.rect(screen, COLORS.DEBT_BAR_FILL, charge_rect)
 
 
-class DebtBomb(BaseEntity):
+class DebtBomb(StaticEntity):
     """
     An explosive that detonates with temporal energy.
     
@@ -414,7 +416,7 @@ class DebtBomb(BaseEntity):
                                (center.x, rect.top - fuse_length), 2)
 
 
-class TimedDoor(BaseEntity):
+class TimedDoor(StaticEntity):
     """
     A door that opens temporarily when triggered.
     
@@ -513,7 +515,7 @@ class TimedDoor(BaseEntity):
             pygame.draw.rect(screen, COLORS.WHITE, rect, 2)
 
 
-class ExitZone(BaseEntity):
+class ExitZone(StaticEntity):
     """
     Level exit trigger zone.
     
@@ -526,6 +528,7 @@ class ExitZone(BaseEntity):
         
         self.color = COLORS.EXIT_ZONE
         self._pulse_timer = 0.0
+        self._glow_surf = pygame.Surface((self.size[0] + 20, self.size[1] + 20), pygame.SRCALPHA)
         
         self.collision_layer = CollisionLayer.TRIGGER
         self.collision_mask = CollisionLayer.PLAYER
@@ -547,10 +550,8 @@ class ExitZone(BaseEntity):
         pulse = (math.sin(self._pulse_timer) + 1) / 2
         glow_alpha = int(30 + 50 * pulse)
         
-        glow_surf = pygame.Surface((self.size[0] + 20, self.size[1] + 20), pygame.SRCALPHA)
-        pygame.draw.rect(glow_surf, (*self.color, glow_alpha),
-                        (0, 0, self.size[0] + 20, self.size[1] + 20))
-        screen.blit(glow_surf, (rect.x - 10, rect.y - 10))
+        self._glow_surf.fill((*self.color, glow_alpha))
+        screen.blit(self._glow_surf, (rect.x - 10, rect.y - 10))
         
         # Main zone
         pygame.draw.rect(screen, self.color, rect)
@@ -559,7 +560,7 @@ class ExitZone(BaseEntity):
         # Exit text would go here with font rendering
 
 
-class Checkpoint(BaseEntity):
+class Checkpoint(StaticEntity):
     """
     Checkpoint that saves player progress.
     
@@ -573,6 +574,7 @@ class Checkpoint(BaseEntity):
         self.color = COLORS.CHECKPOINT
         self.is_activated = False
         self._glow_timer = 0.0
+        self._glow_surf = pygame.Surface((self.size[0] + 20, self.size[1] + 20), pygame.SRCALPHA)
         
         self.collision_layer = CollisionLayer.TRIGGER
         self.collision_mask = CollisionLayer.PLAYER
@@ -598,10 +600,8 @@ class Checkpoint(BaseEntity):
             pulse = (math.sin(self._glow_timer) + 1) / 2
             glow_alpha = int(50 + 30 * pulse)
             
-            glow_surf = pygame.Surface((self.size[0] + 20, self.size[1] + 20), pygame.SRCALPHA)
-            pygame.draw.rect(glow_surf, (*self.color, glow_alpha),
-                           (0, 0, self.size[0] + 20, self.size[1] + 20))
-            screen.blit(glow_surf, (rect.x - 10, rect.y - 10))
+            self._glow_surf.fill((*self.color, glow_alpha))
+            screen.blit(self._glow_surf, (rect.x - 10, rect.y - 10))
             
             color = self.color
         else:
@@ -11,7 +11,7 @@ Design Philosophy:
 - Simple movement, complex strategy
 """
 
-from typing import List, Dict, Any, TYPE_CHECKING
+from typing import List, Dict, Any, Sequence, TYPE_CHECKING
 import pygame
 import math
 
@@ -25,6 +25,14 @@ if TYPE_CHECKING:
     from ..systems.collision import CollisionResult
 
 
+# Normalized movement direction for each held-key bitmask
+# (bit 0 up, bit 1 down, bit 2 left, bit 3 right); opposite keys cancel
+_INPUT_DIRECTIONS = tuple(
+    Vector2(((mask >> 3) & 1) - ((mask >> 2) & 1),
+            ((mask >> 1) & 1) - (mask & 1)).normalized().tuple
+    for mask in range(16)
+)
+
 
 class Player(BaseEntity):
     """
@@ -38,6 +46,9 @@ class Player(BaseEntity):
     - Visual states for frozen/normal/invulnerable
     """
     
+    # Collision layers that kill the player on contact
+    _KILL_MASK = CollisionLayer.ENEMY | CollisionLayer.HAZARD
+    
     def __init__(self, position: Vector2, event_manager: EventManager = None):
         """
         Initialize the player.
@@ -52,12 +63,14 @@ class Player(BaseEntity):
         self.speed = Settings.PLAYER_SPEED
         self.input_vector = Vector2.zero()
         self.facing = Vector2(1, 0)  # Direction player is facing
+        self._move_rect = pygame.Rect(0, 0, self.size[0], self.size[1])  # Wall test scratch
         
         # State
         self.is_dead = False
         self.can_move = True
         self.is_invulnerable = False
         self.invuln_timer = 0.0
+        self._god_mode = Settings.GOD_MODE  # Debug flag, fixed for the session
         
         # Position tracking
         self.spawn_position = position.copy()
@@ -84,6 +97,12 @@ class Player(BaseEntity):
         self._trail_timer = 0.0
         self._trail_max = 8
         
+        # Reused render surfaces: the glow is redrawn in place each frame,
+        # trail dots are cached by (size, alpha, color)
+        glow_size = self.size[0] + 12
+        self._glow_surf = pygame.Surface((glow_size, glow_size), pygame.SRCALPHA)
+        self._trail_cache: Dict[tuple, pygame.Surface] = {}
+        
         # References
         self._event_manager = event_manager or get_event_manager()
         
@@ -103,26 +122,20 @@ class Player(BaseEntity):
             keys: Current keyboard state
         """
         if not self.can_move or self.is_dead:
-            self.input_vector = Vector2.zero()
+            self.input_vector.set(0.0, 0.0)
             return
         
-        # Reset input
-        self.input_vector = Vector2.zero()
-        
-        # Collect directional input
-        if keys[pygame.K_w] or keys[pygame.K_UP]:
-            self.input_vector.y -= 1
-        if keys[pygame.K_s] or keys[pygame.K_DOWN]:
-            self.input_vector.y += 1
-        if keys[pygame.K_a] or keys[pygame.K_LEFT]:
-            self.input_vector.x -= 1
-        if keys[pygame.K_d] or keys[pygame.K_RIGHT]:
-            self.input_vector.x += 1
-        
-        # Normalize diagonal movement
-        if self.input_vector.magnitude() > 0:
-            self.input_vector = self.input_vector.normalized()
-            self.facing = self.input_vector.copy()
+        # Collect directional input as a bitmask and look up the
+        # already-normalized direction (diagonals included)
+        mask = ((keys[pygame.K_w] or keys[pygame.K_UP])
+                | (keys[pygame.K_s] or keys[pygame.K_DOWN]) << 1
+                | (keys[pygame.K_a] or keys[pygame.K_LEFT]) << 2
+                | (keys[pygame.K_d] or keys[pygame.K_RIGHT]) << 3)
+        fx, fy = _INPUT_DIRECTIONS[mask]
+        self.input_vector.set(fx, fy)
+        
+        if fx or fy:
+            self.facing.set(fx, fy)
     
     def update(self, dt: float) -> None:
         """
@@ -157,7 +170,7 @@ class Player(BaseEntity):
         # Update animation
         self._update_animation(dt)
     
-    def update_with_collision(self, dt: float, walls: List[pygame.Rect]) -> None:
+    def update_with_collision(self, dt: float, walls: Sequence[pygame.Rect]) -> None:
         """
         Update player with wall collision handling.
         
@@ -175,37 +188,33 @@ class Player(BaseEntity):
                 self.is_invulnerable = False
         
         # Calculate desired movement
-        if self.can_move and self.input_vector.magnitude() > 0:
-            self.velocity = self.input_vector * self.speed
+        vx = self.input_vector.x
+        vy = self.input_vector.y
+        if self.can_move and (vx or vy):
+            vx *= self.speed
+            vy *= self.speed
+            self.velocity.set(vx, vy)
             
-            # Try movement on each axis separately for sliding
-            # X axis
-            new_x = self.position.x + self.velocity.x * dt
-            test_rect = pygame.Rect(int(new_x), int(self.position.y), 
-                                   self.size[0], self.size[1])
-            
-            can_move_x = True
-            for wall in walls:
-                if test_rect.colliderect(wall):
-                    can_move_x = False
-                    break
+            # Try movement on each axis separately for sliding, skipping
+            # an axis with no input. collidelist() scans every wall in
+            # one C call, and the test rect is reused across frames.
+            test_rect = self._move_rect
             
-            if can_move_x:
-                self.position.x = new_x
+            # X axis
+            if vx:
+                new_x = self.position.x + vx * dt
+                test_rect.x = int(new_x)
+                test_rect.y = int(self.position.y)
+                if test_rect.collidelist(walls) == -1:
+                    self.position.x = new_x
             
             # Y axis
-            new_y = self.position.y + self.velocity.y * dt
-            test_rect = pygame.Rect(int(self.position.x), int(new_y),
-                                   self.size[0], self.size[1])
-            
-            can_move_y = True
-            for wall in walls:
-                if test_rect.colliderect(wall):
-                    can_move_y = False
-                    break
-            
-            if can_move_y:
-                self.position.y = new_y
+            if vy:
+                new_y = self.position.y + vy * dt
+                test_rect.x = int(self.position.x)
+                test_rect.y = int(new_y)
+                if test_rect.collidelist(walls) == -1:
+                    self.position.y = new_y
             
             # Clamp to screen
             self.position.x = clamp(self.position.x, 0,
@@ -213,7 +222,7 @@ class Player(BaseEntity):
             self.position.y = clamp(self.position.y, 0,
                                    Settings.SCREEN_HEIGHT - self.size[1])
         else:
-            self.velocity = Vector2.zero()
+            self.velocity.set(0.0, 0.0)
         
         # Update animation
         self._update_animation(dt)
@@ -224,7 +233,7 @@ class Player(BaseEntity):
         
         # Trail recording
         self._trail_timer += dt
-        if self._trail_timer >= 0.03 and self.velocity.magnitude() > 10:
+        if self._trail_timer >= 0.03 and self.velocity.magnitude_squared() > 100:
             self._trail_timer = 0.0
             self._trail.append(self.center.copy())
             if len(self._trail) > self._trail_max:
@@ -256,9 +265,12 @@ class Player(BaseEntity):
                 alpha = int(60 * t)
                 sz = int(self.size[0] * 0.3 * t)
                 if sz > 0 and alpha > 0:
-                    trail_surf = pygame.Surface((sz * 2, sz * 2), pygame.SRCALPHA)
                     trail_color = (*self.color[:3], alpha)
-                    pygame.draw.circle(trail_surf, trail_color, (sz, sz), sz)
+                    trail_surf = self._trail_cache.get((sz, trail_color))
+                    if trail_surf is None:
+                        trail_surf = pygame.Surface((sz * 2, sz * 2), pygame.SRCALPHA)
+                        pygame.draw.circle(trail_surf, trail_color, (sz, sz), sz)
+                        self._trail_cache[(sz, trail_color)] = trail_surf
                     screen.blit(trail_surf, (int(pos.x - sz), int(pos.y - sz)))
         
         # Determine color based on state
@@ -290,7 +302,8 @@ class Player(BaseEntity):
         
         # Outer glow
         glow_size = self.size[0] + 12
-        glow_surf = pygame.Surface((glow_size, glow_size), pygame.SRCALPHA)
+        glow_surf = self._glow_surf
+        glow_surf.fill((0, 0, 0, 0))
         glow_alpha = 35 if not self.is_time_frozen else 60
         pygame.draw.circle(glow_surf, (*color, glow_alpha),
                           (glow_size // 2, glow_size // 2), glow_size // 2)
@@ -320,10 +333,7 @@ class Player(BaseEntity):
     
     def die(self) -> None:
         """Handle player death."""
-        if self.is_invulnerable or self.is_dead:
-            return
-        
-        if Settings.GOD_MODE:
+        if self._god_mode or self.is_invulnerable or self.is_dead:
             return
         
         self.is_dead = True
@@ -370,7 +380,7 @@ class Player(BaseEntity):
     def on_collision(self, other: 'BaseEntity', result: 'CollisionResult') -> None:
         """Handle collision with other entities."""
         # Death on enemy/hazard collision
-        if other.collision_layer & (CollisionLayer.ENEMY | CollisionLayer.HAZARD):
+        if other.collision_layer & self._KILL_MASK:
             self.die()
     
     def get_state(self) -> Dict[str, Any]:
@@ -13,7 +13,8 @@ Design Philosophy:
 - Smooth transitions between levels
 """
 
-from typing import List, Optional, Dict, Any, TYPE_CHECKING
+from typing import List, Optional, Dict, Any, Tuple, TYPE_CHECKING
+import random
 import pygame
 
 from .level_data import Level, LevelData, EntityData, ALL_LEVELS
@@ -28,6 +29,7 @@ from ..core.settings import Settings
 from ..core.utils import Vector2
 from ..core.events import EventManager, GameEvent, get_event_manager
 from ..entities.player import Player
+from ..entities.base_entity import EntityPool
 
 if TYPE_CHECKING:
     from ..systems.debt_manager import DebtManager
@@ -43,6 +45,21 @@ except ImportError:
 
 from ..entities.interactables import DebtSink, DebtBomb, TimedDoor, ExitZone, Checkpoint
 
+# V2 entities (safe import)
+try:
+    from ..entities.interactables_v2 import TimeDilationZone, TemporalFragment, DebtTransferPod
+    _has_v2_entities = True
+except ImportError:
+    _has_v2_entities = False
+
+# Debt shadow spawn points, one per screen edge: left, right, top, bottom
+_EDGE_SPAWNERS = (
+    lambda: Vector2(0, random.randint(0, Settings.SCREEN_HEIGHT)),
+    lambda: Vector2(Settings.SCREEN_WIDTH, random.randint(0, Settings.SCREEN_HEIGHT)),
+    lambda: Vector2(random.randint(0, Settings.SCREEN_WIDTH), 0),
+    lambda: Vector2(random.randint(0, Settings.SCREEN_WIDTH), Settings.SCREEN_HEIGHT),
+)
+
 
 class LevelManager:
     """
@@ -78,6 +95,69 @@ class LevelManager:
         self.exit_zone: Optional[ExitZone] = None
         self.checkpoints: List[Checkpoint] = []
         
+        # Per-type buckets, filled at spawn time alongside self.entities so
+        # the frame loop never has to classify entities with isinstance
+        self._patrol_drones: List[PatrolDrone] = []
+        self._hunters: List[TemporalHunter] = []
+        self._shadows: List[DebtShadow] = []
+        self._phase_shifters: List[Any] = []
+        self._leeches: List[Any] = []
+        self._swarm_drones: List[Any] = []
+        self._bombs: List[DebtBomb] = []
+        self._sinks: List[DebtSink] = []
+        self._passive: List[Any] = []  # Anything updated with game_dt alone
+        self._kill_entities: List[Any] = []  # Touching these kills the player
+        
+        # Render layers, back to front, in spawn order
+        self._layer_zones: List[Any] = []
+        self._layer_interact: List[Any] = []
+        self._layer_gates: List[Any] = []
+        self._layer_collect: List[Any] = []
+        self._layer_enemies: List[Any] = []
+        
+        self._buckets = (
+            self._patrol_drones, self._hunters, self._shadows,
+            self._phase_shifters, self._leeches, self._swarm_drones,
+            self._bombs, self._sinks, self._passive, self._kill_entities,
+            self._layer_zones, self._layer_interact, self._layer_gates,
+            self._layer_collect, self._layer_enemies
+        )
+        
+        # Every list each entity type joins at spawn: its update bucket,
+        # the kill list and its render layer. Unlisted types are only
+        # updated with game_dt.
+        self._spawn_lists: Dict[type, tuple] = {
+            PatrolDrone: (self._patrol_drones, self._kill_entities, self._layer_enemies),
+            TemporalHunter: (self._hunters, self._kill_entities, self._layer_enemies),
+            DebtShadow: (self._shadows, self._kill_entities, self._layer_enemies),
+            DebtBomb: (self._bombs, self._layer_interact),
+            DebtSink: (self._sinks, self._passive, self._layer_interact),
+            TimedDoor: (self._passive, self._layer_interact),
+            Checkpoint: (self._passive, self._layer_gates),
+            ExitZone: (self._passive, self._layer_gates),
+        }
+        if _has_v3_enemies:
+            self._spawn_lists.update({
+                PhaseShifter: (self._phase_shifters, self._kill_entities, self._layer_enemies),
+                DebtLeech: (self._leeches, self._layer_enemies),
+                SwarmDrone: (self._swarm_drones, self._kill_entities, self._layer_enemies),
+            })
+        if _has_v2_entities:
+            self._spawn_lists.update({
+                TimeDilationZone: (self._passive, self._layer_zones),
+                DebtTransferPod: (self._passive, self._layer_interact),
+                TemporalFragment: (self._passive, self._layer_collect),
+            })
+        
+        # Player rect position at the last exit/checkpoint test
+        self._last_player_xy: Optional[tuple] = None
+        
+        # Set when an entity leaves play; compaction only runs on those frames
+        self._dirty_entities = False
+        
+        # Recycled debt shadows; high debt spawns and dissolves them constantly
+        self._shadow_pool = EntityPool(DebtShadow, 32)
+        
         # References (set externally)
         self._debt_manager = None
         self._time_engine = None
@@ -85,6 +165,12 @@ class LevelManager:
         # State
         self.level_complete = False
         self.level_time = 0.0
+        
+        # Debt at which shadows start spawning, read from Settings per level
+        self._shadow_threshold = Settings.SHADOW_SPAWN_DEBT
+        
+        # get_level_info() result; the static fields are built once per level
+        self._level_info: Optional[Dict[str, Any]] = None
     
     def set_systems(self, debt_manager: 'DebtManager', time_engine: 'TimeEngine') -> None:
         """Set system references for entities."""
@@ -113,8 +199,16 @@ class LevelManager:
         # Reset state
         self.level_complete = False
         self.level_time = 0.0
+        self._level_info = None
+        self._shadow_threshold = Settings.SHADOW_SPAWN_DEBT
+        for shadow in self._shadows:
+            self._shadow_pool.release(shadow)
         self.entities.clear()
         self.checkpoints.clear()
+        for bucket in self._buckets:
+            bucket.clear()
+        self._dirty_entities = False
+        self._last_player_xy = None
         
         # Create tile grid
         self._load_tile_grid(level_data)
@@ -171,21 +265,27 @@ class LevelManager:
         """Spawn exit zone."""
         exit_pos = level_data.get_exit_point()
         self.exit_zone = ExitZone(exit_pos)
-        self.entities.append(self.exit_zone)
+        self._add_entity(self.exit_zone)
     
     def _spawn_checkpoints(self, level_data: LevelData) -> None:
         """Spawn checkpoint entities."""
         for pos in level_data.get_checkpoints():
             checkpoint = Checkpoint(pos)
             self.checkpoints.append(checkpoint)
-            self.entities.append(checkpoint)
+            self._add_entity(checkpoint)
     
     def _spawn_entities(self, level_data: LevelData) -> None:
         """Spawn all entities defined in level data."""
         for entity_data in level_data.entities:
             entity = self._create_entity(entity_data)
             if entity:
-                self.entities.append(entity)
+                self._add_entity(entity)
+    
+    def _add_entity(self, entity: Any) -> None:
+        """Track an entity in self.entities and in its per-type lists."""
+        self.entities.append(entity)
+        for bucket in self._spawn_lists.get(type(entity), (self._passive,)):
+            bucket.append(entity)
     
     def _create_entity(self, data: EntityData) -> Optional[Any]:
         """
@@ -195,125 +295,10 @@ class LevelManager:
             data: Entity definition
             
         Returns:
-            Created entity instance
+            Created entity instance, or None for unknown types
         """
-        position = data.position
-        props = data.properties
-        
-        if data.entity_type == "patrol_drone":
-            # Convert grid patrol points to pixels
-            patrol_points = []
-            for px, py in props.get("patrol_points", []):
-                patrol_points.append(Vector2(
-                    px * Settings.TILE_SIZE + Settings.TILE_SIZE // 2,
-                    py * Settings.TILE_SIZE + Settings.TILE_SIZE // 2
-                ))
-            
-            drone = PatrolDrone(
-                position=position,
-                patrol_points=patrol_points,
-                drone_type=props.get("drone_type", "linear"),
-                speed=props.get("speed")
-            )
-            
-            # Set circular orbit params if applicable
-            if props.get("drone_type") == "circular":
-                drone.orbit_center = Vector2(
-                    position.x + Settings.TILE_SIZE // 2,
-                    position.y + Settings.TILE_SIZE // 2
-                )
-                drone.orbit_radius = props.get("orbit_radius", 100)
-                drone.orbit_speed = props.get("orbit_speed", 1.0)
-            
-            return drone
-        
-        elif data.entity_type == "temporal_hunter":
-            hunter = TemporalHunter(
-                position=position,
-                speed=props.get("speed")
-            )
-            # Target will be set after player is spawned
-            return hunter
-        
-        elif data.entity_type == "debt_sink":
-            sink = DebtSink(
-                position=position,
-                uses=props.get("uses", 1),
-                absorption_amount=props.get("absorption_amount")
-            )
-            if self._debt_manager:
-                sink.set_debt_manager(self._debt_manager)
-            return sink
-        
-        elif data.entity_type == "debt_bomb":
-            bomb = DebtBomb(
-                position=position,
-                trigger_type=props.get("trigger_type", "proximity"),
-                payload=props.get("payload"),
-                radius=props.get("radius")
-            )
-            return bomb
-        
-        elif data.entity_type == "timed_door":
-            door = TimedDoor(
-                position=position,
-                open_duration=props.get("open_duration")
-            )
-            return door
-        
-        # V3.0 Enemy Types
-        elif data.entity_type == "phase_shifter" and _has_v3_enemies:
-            shifter = PhaseShifter(position=position)
-            return shifter
-        
-        elif data.entity_type == "debt_leech" and _has_v3_enemies:
-            leech = DebtLeech(position=position)
-            return leech
-        
-        elif data.entity_type == "swarm_drone" and _has_v3_enemies:
-            drone = SwarmDrone(
-                position=position,
-                target=self.player,
-            )
-            return drone
-        
-        # V2.0 Entity Types
-        elif data.entity_type == "temporal_fragment":
-            try:
-                from ..entities.interactables_v2 import TemporalFragment
-                fragment = TemporalFragment(
-                    position=position,
-                    fragment_id=props.get("fragment_id", 0)
-                )
-                return fragment
-            except ImportError:
-                return None
-        
-        elif data.entity_type == "dilation_zone":
-            try:
-                from ..entities.interactables_v2 import TimeDilationZone
-                zone = TimeDilationZone(
-                    position=position,
-                    zone_type=props.get("zone_type", "safe"),
-                    width=props.get("width", 128),
-                    height=props.get("height", 128)
-                )
-                return zone
-            except ImportError:
-                return None
-        
-        elif data.entity_type == "debt_transfer_pod":
-            try:
-                from ..entities.interactables_v2 import DebtTransferPod
-                pod = DebtTransferPod(
-                    position=position,
-                    pod_id=props.get("pod_id", 0)
-                )
-                return pod
-            except ImportError:
-                return None
-        
-        return None
+        factory = _ENTITY_FACTORIES.get(data.entity_type)
+        return factory(data, self) if factory else None
     
     def update(self, dt: float, game_dt: float) -> None:
         """
@@ -328,84 +313,115 @@ class LevelManager:
         
         self.level_time += dt
         
-        # Update entities
-        for entity in self.entities:
-            if not entity.active:
-                continue
-            
-            # Different entities update differently
-            if isinstance(entity, PatrolDrone):
+        # Update entities, one bucket at a time
+        for entity in self._patrol_drones:
+            if entity.active:
                 entity.update(game_dt)
-            elif isinstance(entity, TemporalHunter):
-                is_frozen = self._time_engine and self._time_engine.is_frozen()
+        
+        is_frozen = bool(self._time_engine and self._time_engine.is_frozen())
+        for entity in self._hunters:
+            if entity.active:
                 entity.update(dt, is_frozen)
-            elif isinstance(entity, DebtShadow):
-                debt = self._debt_manager.current_debt if self._debt_manager else 0
-                entity.update(dt, debt)
-            elif _has_v3_enemies and isinstance(entity, PhaseShifter):
+        
+        for entity in self._phase_shifters:
+            if entity.active:
                 entity.update(dt)
-            elif _has_v3_enemies and isinstance(entity, DebtLeech):
+        
+        for entity in self._leeches:
+            if entity.active:
                 entity.update(dt, self._debt_manager)
-            elif _has_v3_enemies and isinstance(entity, SwarmDrone):
+        
+        for entity in self._swarm_drones:
+            if entity.active:
                 entity.update(dt)
-            elif isinstance(entity, DebtBomb):
-                player_pos = self.player.center if self.player else None
+                if not entity.active:
+                    self._dirty_entities = True
+        
+        player_pos = self.player.center if self.player else None
+        for entity in self._bombs:
+            if entity.active:
                 explosion = entity.update(game_dt, player_pos)
                 if explosion:
                     self._handle_explosion(explosion)
-            else:
+                if not entity.active:
+                    self._dirty_entities = True
+        
+        for entity in self._passive:
+            if entity.active:
                 entity.update(game_dt)
         
-        # Set hunter targets
-        for entity in self.entities:
-            if isinstance(entity, TemporalHunter) and self.player:
-                entity.set_target(self.player)
-            elif _has_v3_enemies and isinstance(entity, PhaseShifter) and self.player:
-                entity.set_target(self.player)
-            elif _has_v3_enemies and isinstance(entity, DebtLeech) and self.player:
-                entity.set_target(self.player)
+        # Shadows go last: leeches drain debt before shadows read it
+        debt = self._debt_manager.current_debt if self._debt_manager else 0
+        for entity in self._shadows:
+            if entity.active:
+                entity.update(dt, debt)
+                if not entity.active:
+                    self._dirty_entities = True
+        
+        # The player does not move during this update; sync its rect once
+        player_rect = self.player.get_rect() if self.player else None
+        
+        # The exit and checkpoints never move, so the player can only start
+        # touching one on a frame where its rect moved. Position is compared
+        # rather than velocity: anchors, rewind and respawn teleport it.
+        player_xy = (player_rect.x, player_rect.y) if player_rect else None
+        player_moved = player_xy != self._last_player_xy
+        self._last_player_xy = player_xy
         
         # Check player-exit collision
-        if self.player and self.exit_zone:
-            if self.player.get_rect().colliderect(self.exit_zone.get_rect()):
+        if player_moved and self.player and self.exit_zone:
+            if player_rect.colliderect(self.exit_zone.get_rect()):
+                # The level is over; no checkpoint, sink, death or shadow
+                # spawn may follow on the same frame
                 self._complete_level()
+                return
         
         # Check checkpoint collisions
-        if self.player:
+        if player_moved and self.player:
             for checkpoint in self.checkpoints:
                 if not checkpoint.is_activated:
-                    if self.player.get_rect().colliderect(checkpoint.get_rect()):
+                    if player_rect.colliderect(checkpoint.get_rect()):
                         checkpoint.activate()
                         self.player.set_checkpoint(checkpoint.position)
                         self._event_manager.emit(GameEvent.CHECKPOINT_REACHED, {
                             'position': (checkpoint.position.x, checkpoint.position.y)
                         })
         
-        # Check debt sink collisions
+        # Check debt sink collisions (every frame: standing on a sink keeps
+        # spending its uses)
         if self.player:
-            for entity in self.entities:
-                if isinstance(entity, DebtSink) and not entity.is_depleted:
-                    if self.player.get_rect().colliderect(entity.get_rect()):
+            for entity in self._sinks:
+                if not entity.is_depleted:
+                    if player_rect.colliderect(entity.get_rect()):
                         entity.activate()
         
         # Check enemy collisions
         if self.player and not self.player.is_invulnerable:
-            player_rect = self.player.get_rect()
-            kill_types = [PatrolDrone, TemporalHunter, DebtShadow]
-            if _has_v3_enemies:
-                kill_types.extend([PhaseShifter, SwarmDrone])
-            for entity in self.entities:
-                if isinstance(entity, tuple(kill_types)):
-                    if player_rect.colliderect(entity.get_rect()):
-                        self.player.die()
-                        break
-        
-        # Spawn debt shadows at high debt
-        if self._debt_manager and self._debt_manager.current_debt >= Settings.SHADOW_SPAWN_DEBT:
-            self._maybe_spawn_debt_shadow()
-        
-        # Remove inactive entities
-        self.entities = [e for e in self.entities if e.active]
+            for entity in self._kill_entities:
+                if player_rect.colliderect(entity.get_rect()):
+                    self.player.die()
+                    break
+        
+        # Spawn debt shadows at high debt (re-read: a sink may have absorbed
+        # some debt since the shadows updated)
+        if self._debt_manager:
+            debt = self._debt_manager.current_debt
+            if debt >= self._shadow_threshold:
+                self._maybe_spawn_debt_shadow(debt)
+        
+        # Remove inactive entities, only on frames where one left play
+        if self._dirty_entities:
+            self._remove_inactive()
+    
+    def _remove_inactive(self) -> None:
+        """Drop inactive entities from every list, keeping spawn order."""
+        for shadow in self._shadows:
+            if not shadow.active:
+                self._shadow_pool.release(shadow)
+        self.entities[:] = [e for e in self.entities if e.active]
+        for bucket in self._buckets:
+            bucket[:] = [e for e in bucket if e.active]
+        self._dirty_entities = False
     
     def _handle_explosion(self, explosion: dict) -> None:
         """Handle debt bomb explosion effects."""
@@ -413,30 +429,23 @@ class LevelManager:
         # Currently only provides visual feedback
 
     
-    def _maybe_spawn_debt_shadow(self) -> None:
-        """Potentially spawn a debt shadow."""
-        # Check if we already have shadows
-        shadow_count = sum(1 for e in self.entities if isinstance(e, DebtShadow))
+    def _maybe_spawn_debt_shadow(self, debt: float) -> None:
+        """
+        Potentially spawn a debt shadow.
         
-        # Limit shadows based on debt
-        max_shadows = int(self._debt_manager.current_debt / 10)
+        Args:
+            debt: Current debt level
+        """
+        # Limit shadows based on debt; the bucket still holds any shadow
+        # that dissolved this frame, as self.entities did
+        max_shadows = int(debt / 10)
         
-        if shadow_count < max_shadows and self.player:
+        if len(self._shadows) < max_shadows and self.player:
             # Spawn shadow at edge of screen
-            import random
-            edge = random.choice(['left', 'right', 'top', 'bottom'])
+            pos = _EDGE_SPAWNERS[random.randrange(4)]()
             
-            if edge == 'left':
-                pos = Vector2(0, random.randint(0, Settings.SCREEN_HEIGHT))
-            elif edge == 'right':
-                pos = Vector2(Settings.SCREEN_WIDTH, random.randint(0, Settings.SCREEN_HEIGHT))
-            elif edge == 'top':
-                pos = Vector2(random.randint(0, Settings.SCREEN_WIDTH), 0)
-            else:
-                pos = Vector2(random.randint(0, Settings.SCREEN_WIDTH), Settings.SCREEN_HEIGHT)
-            
-            shadow = DebtShadow(pos, self.player)
-            self.entities.append(shadow)
+            shadow = self._shadow_pool.acquire(pos, self.player)
+            self._add_entity(shadow)
     
     def _complete_level(self) -> None:
         """Handle level completion."""
@@ -458,86 +467,211 @@ class LevelManager:
         Args:
             screen: Surface to render to
         """
-        # Import V2 entities for type checking
-        try:
-            from ..entities.interactables_v2 import TimeDilationZone, TemporalFragment, DebtTransferPod
-            has_v2_entities = True
-        except ImportError:
-            has_v2_entities = False
-        
         # Render tiles
         if self.tile_grid:
             self.tile_grid.render(screen)
         
-        # First layer: Dilation zones (background effect)
-        if has_v2_entities:
-            for entity in self.entities:
-                if isinstance(entity, TimeDilationZone):
-                    entity.render(screen)
-        
-        # Second layer: interactables
-        for entity in self.entities:
-            if isinstance(entity, (DebtSink, DebtBomb, TimedDoor)):
-                entity.render(screen)
-            elif has_v2_entities and isinstance(entity, DebtTransferPod):
-                entity.render(screen)
-        
-        # Third layer: checkpoints and exit
-        for entity in self.entities:
-            if isinstance(entity, (Checkpoint, ExitZone)):
-                entity.render(screen)
-        
-        # Fourth layer: collectibles (fragments)
-        if has_v2_entities:
-            for entity in self.entities:
-                if isinstance(entity, TemporalFragment):
-                    entity.render(screen)
-        
-        # Fifth layer: enemies
-        enemy_types = [PatrolDrone, TemporalHunter, DebtShadow]
-        if _has_v3_enemies:
-            enemy_types.extend([PhaseShifter, DebtLeech, SwarmDrone])
-        for entity in self.entities:
-            if isinstance(entity, tuple(enemy_types)):
+        # Dilation zones, interactables, checkpoints and exit,
+        # collectibles, then enemies
+        for layer in (self._layer_zones, self._layer_interact, self._layer_gates,
+                      self._layer_collect, self._layer_enemies):
+            for entity in layer:
                 entity.render(screen)
         
         # Player renders last (on top)
         if self.player:
             self.player.render(screen)
     
-    def get_wall_rects(self) -> List[pygame.Rect]:
+    def get_wall_rects(self) -> Tuple[pygame.Rect, ...]:
         """Get all wall collision rectangles."""
         if self.tile_grid:
             return self.tile_grid.get_wall_rects()
-        return []
+        return ()
     
-    def get_hazard_rects(self) -> List[pygame.Rect]:
+    def get_hazard_rects(self) -> Tuple[pygame.Rect, ...]:
         """Get rectangles for all hazard tiles (danger zones)."""
         if self.tile_grid:
             return self.tile_grid.get_hazard_rects()
-        return []
+        return ()
     
     def has_next_level(self) -> bool:
         """Check if there's another level after current."""
         return self.current_level_index < len(self.levels) - 1
     
     def get_level_info(self) -> Dict[str, Any]:
-        """Get current level information."""
+        """
+        Get current level information.
+        
+        The same dict is returned on every call for a level, with 'time'
+        and 'completed' refreshed; callers must treat it as read-only.
+        """
         if not self.current_level:
             return {}
         
-        # Try to get hint from level data
-        hint = ""
-        if self.current_level_index < len(self.levels):
-            level_data = self.levels[self.current_level_index]
-            hint = getattr(level_data, 'hint', '')
-        
-        return {
-            'name': self.current_level.name,
-            'description': self.current_level.description,
-            'index': self.current_level_index + 1,
-            'total': len(self.levels),
-            'time': self.level_time,
-            'completed': self.level_complete,
-            'hint': hint
-        }
+        info = self._level_info
+        if info is None:
+            # Try to get hint from level data
+            hint = ""
+            if self.current_level_index < len(self.levels):
+                level_data = self.levels[self.current_level_index]
+                hint = getattr(level_data, 'hint', '')
+            
+            info = self._level_info = {
+                'name': self.current_level.name,
+                'description': self.current_level.description,
+                'index': self.current_level_index + 1,
+                'total': len(self.levels),
+                'time': self.level_time,
+                'completed': self.level_complete,
+                'hint': hint
+            }
+        else:
+            info['time'] = self.level_time
+            info['completed'] = self.level_complete
+        
+        return info
+
+
+# =====================================================================
+# ENTITY FACTORIES
+# =====================================================================
+# Each builds one entity type from its EntityData; the LevelManager is
+# passed for the systems and player some types need at spawn.
+
+def _make_patrol_drone(data: EntityData, manager: 'LevelManager') -> PatrolDrone:
+    position = data.position
+    props = data.properties
+    
+    # Convert grid patrol points to pixels
+    patrol_points = []
+    for px, py in props.get("patrol_points", []):
+        patrol_points.append(Vector2(
+            px * Settings.TILE_SIZE + Settings.TILE_SIZE // 2,
+            py * Settings.TILE_SIZE + Settings.TILE_SIZE // 2
+        ))
+    
+    drone = PatrolDrone(
+        position=position,
+        patrol_points=patrol_points,
+        drone_type=props.get("drone_type", "linear"),
+        speed=props.get("speed")
+    )
+    
+    # Set circular orbit params if applicable
+    if props.get("drone_type") == "circular":
+        drone.orbit_center = Vector2(
+            position.x + Settings.TILE_SIZE // 2,
+            position.y + Settings.TILE_SIZE // 2
+        )
+        drone.orbit_radius = props.get("orbit_radius", 100)
+        drone.orbit_speed = props.get("orbit_speed", 1.0)
+    
+    return drone
+
+
+def _make_temporal_hunter(data: EntityData, manager: 'LevelManager') -> TemporalHunter:
+    hunter = TemporalHunter(
+        position=data.position,
+        speed=data.properties.get("speed")
+    )
+    # The player is spawned before level entities and kept for the whole level
+    if manager.player:
+        hunter.set_target(manager.player)
+    return hunter
+
+
+def _make_debt_sink(data: EntityData, manager: 'LevelManager') -> DebtSink:
+    props = data.properties
+    sink = DebtSink(
+        position=data.position,
+        uses=props.get("uses", 1),
+        absorption_amount=props.get("absorption_amount")
+    )
+    if manager._debt_manager:
+        sink.set_debt_manager(manager._debt_manager)
+    return sink
+
+
+def _make_debt_bomb(data: EntityData, manager: 'LevelManager') -> DebtBomb:
+    props = data.properties
+    return DebtBomb(
+        position=data.position,
+        trigger_type=props.get("trigger_type", "proximity"),
+        payload=props.get("payload"),
+        radius=props.get("radius")
+    )
+
+
+def _make_timed_door(data: EntityData, manager: 'LevelManager') -> TimedDoor:
+    return TimedDoor(
+        position=data.position,
+        open_duration=data.properties.get("open_duration")
+    )
+
+
+
+def _make_phase_shifter(data: EntityData, manager: 'LevelManager') -> Any:
+    shifter = PhaseShifter(position=data.position)
+    if manager.player:
+        shifter.set_target(manager.player)
+    return shifter
+
+
+def _make_debt_leech(data: EntityData, manager: 'LevelManager') -> Any:
+    leech = DebtLeech(position=data.position)
+    if manager.player:
+        leech.set_target(manager.player)
+    return leech
+
+
+def _make_swarm_drone(data: EntityData, manager: 'LevelManager') -> Any:
+    return SwarmDrone(position=data.position, target=manager.player)
+
+
+def _make_temporal_fragment(data: EntityData, manager: 'LevelManager') -> Any:
+    return TemporalFragment(
+        position=data.position,
+        fragment_id=data.properties.get("fragment_id", 0)
+    )
+
+
+def _make_dilation_zone(data: EntityData, manager: 'LevelManager') -> Any:
+    props = data.properties
+    return TimeDilationZone(
+        position=data.position,
+        zone_type=props.get("zone_type", "safe"),
+        width=props.get("width", 128),
+        height=props.get("height", 128)
+    )
+
+
+def _make_debt_transfer_pod(data: EntityData, manager: 'LevelManager') -> Any:
+    return DebtTransferPod(
+        position=data.position,
+        pod_id=data.properties.get("pod_id", 0)
+    )
+
+
+_ENTITY_FACTORIES = {
+    "patrol_drone": _make_patrol_drone,
+    "temporal_hunter": _make_temporal_hunter,
+    "debt_sink": _make_debt_sink,
+    "debt_bomb": _make_debt_bomb,
+    "timed_door": _make_timed_door,
+}
+
+# V3.0 Enemy Types
+if _has_v3_enemies:
+    _ENTITY_FACTORIES.update({
+        "phase_shifter": _make_phase_shifter,
+        "debt_leech": _make_debt_leech,
+        "swarm_drone": _make_swarm_drone,
+    })
+
+# V2.0 Entity Types
+if _has_v2_entities:
+    _ENTITY_FACTORIES.update({
+        "temporal_fragment": _make_temporal_fragment,
+        "dilation_zone": _make_dilation_zone,
+        "debt_transfer_pod": _make_debt_transfer_pod,
+    })
@@ -11,7 +11,7 @@ Design Philosophy:
 """
 
 from enum import Enum, auto
-from typing import Tuple
+from typing import Dict, Tuple
 import pygame
 
 from ..core.settings import Settings, COLORS
@@ -88,6 +88,25 @@ class Tile:
         },
     }
     
+    # PROPERTIES flattened to (solid, color, hazard) per type, so building
+    # a tile unpacks one tuple instead of doing three string-keyed lookups
+    _PROPERTY_TUPLES: Dict[TileType, Tuple[bool, Tuple[int, int, int], bool]] = {
+        tile_type: (props['solid'], props['color'], props['hazard'])
+        for tile_type, props in PROPERTIES.items()
+    }
+    
+    # A level holds hundreds of tiles; skip the per-instance __dict__
+    __slots__ = ('type', 'grid_x', 'grid_y', 'x', 'y',
+                 'solid', 'color', 'hazard', 'rect', '_surface_key')
+    
+    # Pre-rendered tile art keyed by (type, checkerboard parity), each with
+    # its blit offset from the tile's top-left corner (some strokes spill
+    # past the tile edge)
+    _surface_cache: Dict[Tuple[TileType, int], Tuple[pygame.Surface, int, int]] = {}
+    
+    # Fill for the undrawn parts of a cached surface; no tile art uses it
+    _CACHE_COLORKEY = (255, 0, 255)
+    
     def __init__(self, tile_type: TileType, grid_x: int, grid_y: int):
         """
         Initialize a tile.
@@ -106,14 +125,15 @@ class Tile:
         self.y = grid_y * Settings.TILE_SIZE
         
         # Cache properties
-        props = self.PROPERTIES.get(tile_type, self.PROPERTIES[TileType.EMPTY])
-        self.solid = props['solid']
-        self.color = props['color']
-        self.hazard = props['hazard']
+        self.solid, self.color, self.hazard = self._PROPERTY_TUPLES.get(
+            tile_type, self._PROPERTY_TUPLES[TileType.EMPTY])
         
         # Cache rect for collision
         self.rect = pygame.Rect(self.x, self.y, 
                                Settings.TILE_SIZE, Settings.TILE_SIZE)
+        
+        # Render cache key; only floors use the checkerboard parity
+        self._surface_key = (tile_type, (grid_x + grid_y) & 1)
     
     def get_rect(self) -> pygame.Rect:
         """Get tile's collision rectangle."""
@@ -126,19 +146,63 @@ class Tile:
         Args:
             screen: Surface to render to
         """
+        screen.blit(*self.get_blit())
+    
+    def get_blit(self) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """
+        Get the pre-rendered tile surface and where to blit it.
+        
+        Returns:
+            (surface, destination) pair, as taken by Surface.blits
+        """
+        cached = Tile._surface_cache.get(self._surface_key)
+        if cached is None:
+            cached = self._build_surface()
+            Tile._surface_cache[self._surface_key] = cached
+        
+        surface, offset_x, offset_y = cached
+        return surface, (self.x + offset_x, self.y + offset_y)
+    
+    def _build_surface(self) -> Tuple[pygame.Surface, int, int]:
+        """Rasterize this tile's art once, cropped to what was drawn."""
+        # Hazard stripes start a full tile to the left and are 3 px thick,
+        # so leave a two-tile margin on every side
+        margin = Settings.TILE_SIZE * 2
+        canvas = pygame.Surface((Settings.TILE_SIZE + margin * 2,
+                                 Settings.TILE_SIZE + margin * 2))
+        canvas.fill(self._CACHE_COLORKEY)
+        canvas.set_colorkey(self._CACHE_COLORKEY)
+        self._draw(canvas, margin, margin)
+        
+        bounds = canvas.get_bounding_rect()
+        surface = canvas.subsurface(bounds).copy().convert()
+        surface.set_colorkey(self._CACHE_COLORKEY)
+        return surface, bounds.x - margin, bounds.y - margin
+    
+    def _draw(self, screen: pygame.Surface, x: int, y: int) -> None:
+        """
+        Draw the tile's neon-abyss visuals with its top-left at (x, y).
+        
+        Args:
+            screen: Surface to draw on
+            x: Left edge in surface coordinates
+            y: Top edge in surface coordinates
+        """
+        rect = pygame.Rect(x, y, Settings.TILE_SIZE, Settings.TILE_SIZE)
+        
         # Base color fill
-        pygame.draw.rect(screen, self.color, self.rect)
+        pygame.draw.rect(screen, self.color, rect)
         
         # Add subtle grid pattern to floors
         if not self.solid and not self.hazard:
             # Subtle checkerboard — darker alternate squares
-            if (self.grid_x + self.grid_y) % 2 == 0:
+            if self._surface_key[1] == 0:
                 pattern_color = (
                     min(255, self.color[0] + 3),
                     min(255, self.color[1] + 3),
                     min(255, self.color[2] + 6)
                 )
-                inner_rect = self.rect.inflate(-2, -2)
+                inner_rect = rect.inflate(-2, -2)
                 pygame.draw.rect(screen, pattern_color, inner_rect)
             # Faint grid lines for depth
             line_color = (
@@ -146,7 +210,7 @@ class Tile:
                 min(255, self.color[1] + 10),
                 min(255, self.color[2] + 15)
             )
-            pygame.draw.rect(screen, line_color, self.rect, 1)
+            pygame.draw.rect(screen, line_color, rect, 1)
         
         # Wall rendering with polished 3D beveled edges
         if self.solid:
@@ -154,22 +218,22 @@ class Tile:
             sh = getattr(COLORS, 'WALL_SHADOW', (14, 14, 28))
             # Top highlight
             pygame.draw.line(screen, hl,
-                           (self.x, self.y),
-                           (self.x + Settings.TILE_SIZE - 1, self.y), 2)
+                           (x, y),
+                           (x + Settings.TILE_SIZE - 1, y), 2)
             # Left highlight
             pygame.draw.line(screen, hl,
-                           (self.x, self.y),
-                           (self.x, self.y + Settings.TILE_SIZE - 1), 2)
+                           (x, y),
+                           (x, y + Settings.TILE_SIZE - 1), 2)
             # Bottom shadow
             pygame.draw.line(screen, sh,
-                           (self.x, self.y + Settings.TILE_SIZE - 1),
-                           (self.x + Settings.TILE_SIZE - 1, self.y + Settings.TILE_SIZE - 1), 2)
+                           (x, y + Settings.TILE_SIZE - 1),
+                           (x + Settings.TILE_SIZE - 1, y + Settings.TILE_SIZE - 1), 2)
             # Right shadow
             pygame.draw.line(screen, sh,
-                           (self.x + Settings.TILE_SIZE - 1, self.y),
-                           (self.x + Settings.TILE_SIZE - 1, self.y + Settings.TILE_SIZE - 1), 2)
+                           (x + Settings.TILE_SIZE - 1, y),
+                           (x + Settings.TILE_SIZE - 1, y + Settings.TILE_SIZE - 1), 2)
             # Inner highlight pip for depth
-            inner = self.rect.inflate(-8, -8)
+            inner = rect.inflate(-8, -8)
             pygame.draw.rect(screen, (
                 min(255, self.color[0] + 6),
                 min(255, self.color[1] + 6),
@@ -182,9 +246,9 @@ class Tile:
             stripe_color = (danger_color[0], danger_color[1] // 2, danger_color[2] // 2)
             for i in range(0, Settings.TILE_SIZE * 2, 16):
                 pygame.draw.line(screen, stripe_color,
-                               (self.x + i - Settings.TILE_SIZE, self.y),
-                               (self.x + i, self.y + Settings.TILE_SIZE), 3)
-            pygame.draw.rect(screen, danger_color, self.rect, 2)
+                               (x + i - Settings.TILE_SIZE, y),
+                               (x + i, y + Settings.TILE_SIZE), 3)
+            pygame.draw.rect(screen, danger_color, rect, 2)
     
     def render_highlight(self, screen: pygame.Surface, 
                         color: Tuple[int, int, int, int]) -> None:
@@ -210,6 +274,18 @@ class TileGrid:
     and collision queries.
     """
     
+    # Map characters accepted by from_string_map
+    _TILE_CHARS = {
+        '.': TileType.EMPTY,
+        '#': TileType.WALL,
+        'S': TileType.SPAWN,
+        'E': TileType.EXIT,
+        'C': TileType.CHECKPOINT,
+        'X': TileType.HAZARD,
+        ' ': TileType.FLOOR_DARK,
+        '-': TileType.FLOOR_LIGHT,
+    }
+    
     def __init__(self, width: int, height: int):
         """
         Initialize an empty tile grid.
@@ -227,9 +303,15 @@ class TileGrid:
             for y in range(height)
         ]
         
-        # Cache wall rects for collision
-        self._wall_rects: list = []
+        # Cache wall and hazard rects for collision; tuples, so callers
+        # can't mutate the cache behind the _dirty flag
+        self._wall_rects: Tuple[pygame.Rect, ...] = ()
+        self._hazard_rects: Tuple[pygame.Rect, ...] = ()
         self._dirty = True
+        
+        # (surface, position) pairs for one Surface.blits call per frame
+        self._blit_sequence: list = []
+        self._blits_dirty = True
     
     def set_tile(self, grid_x: int, grid_y: int, tile_type: TileType) -> None:
         """
@@ -243,6 +325,7 @@ class TileGrid:
         if 0 <= grid_x < self.width and 0 <= grid_y < self.height:
             self.tiles[grid_y][grid_x] = Tile(tile_type, grid_x, grid_y)
             self._dirty = True
+            self._blits_dirty = True
     
     def get_tile(self, grid_x: int, grid_y: int) -> Tile:
         """
@@ -274,31 +357,38 @@ class TileGrid:
         grid_y = int(y // Settings.TILE_SIZE)
         return self.get_tile(grid_x, grid_y)
     
-    def get_wall_rects(self) -> list:
+    def get_wall_rects(self) -> Tuple[pygame.Rect, ...]:
         """
         Get all wall collision rectangles.
         
         Returns:
-            List of pygame.Rect for all solid tiles
+            Tuple of pygame.Rect for all solid tiles
         """
         if self._dirty:
-            self._wall_rects = []
-            for row in self.tiles:
-                for tile in row:
-                    if tile.solid:
-                        self._wall_rects.append(tile.rect)
-            self._dirty = False
+            self._rebuild_rect_caches()
         
         return self._wall_rects
     
-    def get_hazard_rects(self) -> list:
+    def get_hazard_rects(self) -> Tuple[pygame.Rect, ...]:
         """Return rects for all hazard tiles (danger zones)."""
-        rects = []
+        if self._dirty:
+            self._rebuild_rect_caches()
+        
+        return self._hazard_rects
+    
+    def _rebuild_rect_caches(self) -> None:
+        """Collect wall and hazard rects in one pass over the grid."""
+        wall_rects = []
+        hazard_rects = []
         for row in self.tiles:
             for tile in row:
-                if tile.type == TileType.HAZARD:
-                    rects.append(tile.rect)
-        return rects
+                if tile.solid:
+                    wall_rects.append(tile.rect)
+                elif tile.type == TileType.HAZARD:
+                    hazard_rects.append(tile.rect)
+        self._wall_rects = tuple(wall_rects)
+        self._hazard_rects = tuple(hazard_rects)
+        self._dirty = False
     
     def is_solid(self, grid_x: int, grid_y: int) -> bool:
         """Check if tile at position is solid."""
@@ -317,9 +407,11 @@ class TileGrid:
         Args:
             screen: Surface to render to
         """
-        for row in self.tiles:
-            for tile in row:
-                tile.render(screen)
+        if self._blits_dirty:
+            self._blit_sequence = [tile.get_blit() for row in self.tiles for tile in row]
+            self._blits_dirty = False
+        
+        screen.blits(self._blit_sequence, doreturn=False)
     
     def from_string_map(self, string_map: list) -> None:
         """
@@ -337,19 +429,15 @@ class TileGrid:
             'X' = Hazard
             ' ' = Empty (dark floor)
         """
-        tile_chars = {
-            '.': TileType.EMPTY,
-            '#': TileType.WALL,
-            'S': TileType.SPAWN,
-            'E': TileType.EXIT,
-            'C': TileType.CHECKPOINT,
-            'X': TileType.HAZARD,
-            ' ': TileType.FLOOR_DARK,
-            '-': TileType.FLOOR_LIGHT,
-        }
+        tile_chars = self._TILE_CHARS
+        empty = TileType.EMPTY
+        
+        # Write each row in place rather than going through set_tile, which
+        # re-checks bounds and re-flags the caches for every character
+        for y, row in enumerate(string_map[:self.height]):
+            tiles_row = self.tiles[y]
+            for x, char in enumerate(row[:self.width]):
+                tiles_row[x] = Tile(tile_chars.get(char, empty), x, y)
         
-        for y, row in enumerate(string_map):
-            for x, char in enumerate(row):
-                if x < self.width and y < self.height:
-                    tile_type = tile_chars.get(char, TileType.EMPTY)
-                    self.set_tile(x, y, tile_type)
+        self._dirty = True
+        self._blits_dirty = True
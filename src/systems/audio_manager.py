@@ -68,12 +68,53 @@ class ProceduralSoundGenerator:
     
     SAMPLE_RATE = 44100
     
+    # Sample time axes keyed by (num_samples, duration); the generators
+    # reuse a handful of durations, so each axis is built only once.
+    # Axes are float32 so the waveform math built on them stays single
+    # precision; the int16 output can't resolve the difference anyway.
+    _t_cache: Dict[tuple, np.ndarray] = {}
+    
+    @staticmethod
+    def _time_axis(num_samples: int, duration: float) -> np.ndarray:
+        """Get the read-only sample times for a sound of this length."""
+        key = (num_samples, duration)
+        t = ProceduralSoundGenerator._t_cache.get(key)
+        if t is None:
+            t = np.linspace(0, duration, num_samples, False, dtype=np.float32)
+            t.setflags(write=False)
+            ProceduralSoundGenerator._t_cache[key] = t
+        return t
+    
+    @staticmethod
+    def _phase(freq: np.ndarray) -> np.ndarray:
+        """
+        Integrate per-sample frequencies (Hz) into a float32 phase (radians).
+        
+        The running sum is kept in float64 so long sweeps don't drift.
+        """
+        phase = np.cumsum(freq, dtype=np.float64)
+        phase *= 2 * np.pi / ProceduralSoundGenerator.SAMPLE_RATE
+        return phase.astype(np.float32)
+    
+    @staticmethod
+    def _to_stereo(wave: np.ndarray) -> np.ndarray:
+        """
+        Convert a mono float wave in [-1, 1] to 16-bit stereo.
+        
+        Both channels are written straight into one preallocated buffer,
+        so no intermediate int16 copy or column_stack result is built.
+        """
+        stereo = np.empty((len(wave), 2), dtype=np.int16)
+        stereo[:, 0] = wave * 32767
+        stereo[:, 1] = stereo[:, 0]
+        return stereo
+    
     @staticmethod
     def generate_sine_wave(frequency: float, duration: float, 
                           volume: float = 0.5, fade_out: bool = True) -> np.ndarray:
         """Generate a pure sine wave tone."""
         num_samples = int(ProceduralSoundGenerator.SAMPLE_RATE * duration)
-        t = np.linspace(0, duration, num_samples, False)
+        t = ProceduralSoundGenerator._time_axis(num_samples, duration)
         wave = np.sin(2 * np.pi * frequency * t) * volume
         
         if fade_out:
@@ -82,20 +123,18 @@ class ProceduralSoundGenerator:
             wave = wave * fade
         
         # Convert to 16-bit stereo
-        wave = (wave * 32767).astype(np.int16)
-        stereo = np.column_stack((wave, wave))
-        return stereo
+        return ProceduralSoundGenerator._to_stereo(wave)
     
     @staticmethod
     def generate_sweep(start_freq: float, end_freq: float, duration: float,
                       volume: float = 0.5, wave_type: str = 'sine') -> np.ndarray:
         """Generate a frequency sweep (ascending or descending)."""
         num_samples = int(ProceduralSoundGenerator.SAMPLE_RATE * duration)
-        t = np.linspace(0, duration, num_samples, False)
+        t = ProceduralSoundGenerator._time_axis(num_samples, duration)
         
         # Exponential frequency sweep
         freq = start_freq * (end_freq / start_freq) ** (t / duration)
-        phase = 2 * np.pi * np.cumsum(freq) / ProceduralSoundGenerator.SAMPLE_RATE
+        phase = ProceduralSoundGenerator._phase(freq)
         
         if wave_type == 'sine':
             wave = np.sin(phase)
@@ -110,8 +149,29 @@ class ProceduralSoundGenerator:
         fade = np.exp(-t * 2 / duration)
         wave = wave * fade
         
-        wave = (wave * 32767).astype(np.int16)
-        return np.column_stack((wave, wave))
+        return ProceduralSoundGenerator._to_stereo(wave)
+    
+    @staticmethod
+    def _pink_filter(noise: np.ndarray) -> np.ndarray:
+        """
+        Apply a 4-tap IIR low-pass that turns white noise pink-ish.
+        
+        The filter's frequency response is applied in one FFT pass rather
+        than running the recurrence sample by sample. Zero-padding to at
+        least twice the length keeps the circular wrap out of the result,
+        which matches scipy.signal.lfilter with these coefficients to ~1e-8.
+        """
+        b = [0.049922035, -0.095993537, 0.050612699, -0.004408786]
+        a = [1.0, -2.494956002, 2.017265875, -0.522189400]
+        num_samples = len(noise)
+        n_fft = 1 << (2 * num_samples - 1).bit_length()
+        
+        # H(z) = B(z) / A(z) sampled on the unit circle, z^-1 = e^(-jw)
+        z_inv = np.exp(-1j * np.linspace(0, np.pi, n_fft // 2 + 1))
+        response = np.polyval(b[::-1], z_inv) / np.polyval(a[::-1], z_inv)
+        
+        spectrum = np.fft.rfft(noise, n_fft) * response
+        return np.fft.irfft(spectrum, n_fft)[:num_samples].astype(np.float32)
     
     @staticmethod
     def generate_noise_burst(duration: float, volume: float = 0.3,
@@ -123,51 +183,40 @@ class ProceduralSoundGenerator:
         num_samples = int(ProceduralSoundGenerator.SAMPLE_RATE * duration)
         
         # White noise
-        noise = np.random.uniform(-1, 1, num_samples)
+        noise = np.random.uniform(-1, 1, num_samples).astype(np.float32)
         
         if filter_type == 'pink':
-            # Simple low-pass filter for pink-ish noise
-            b = [0.049922035, -0.095993537, 0.050612699, -0.004408786]
-            a = [1, -2.494956002, 2.017265875, -0.522189400]
-            try:
-                from scipy import signal
-                noise = signal.lfilter(b, a, noise)
-            except ImportError:
-                pass  # Fall back to white noise
-            except Exception:
-                pass  # Fall back to white noise
+            noise = ProceduralSoundGenerator._pink_filter(noise)
         
         # Apply envelope
-        t = np.linspace(0, duration, num_samples, False)
+        t = ProceduralSoundGenerator._time_axis(num_samples, duration)
         envelope = np.exp(-t * 5 / duration)
         noise = noise * envelope * volume
         
-        noise = (noise * 32767).astype(np.int16)
-        return np.column_stack((noise, noise))
+        return ProceduralSoundGenerator._to_stereo(noise)
     
     @staticmethod
     def generate_blip(frequency: float, duration: float = 0.1,
                      volume: float = 0.4) -> np.ndarray:
         """Generate a short blip/beep sound."""
         num_samples = int(ProceduralSoundGenerator.SAMPLE_RATE * duration)
-        t = np.linspace(0, duration, num_samples, False)
+        t = ProceduralSoundGenerator._time_axis(num_samples, duration)
         
         # Quick attack, quick decay
         envelope = np.sin(np.pi * t / duration)
         wave = np.sin(2 * np.pi * frequency * t) * envelope * volume
         
-        wave = (wave * 32767).astype(np.int16)
-        return np.column_stack((wave, wave))
+        return ProceduralSoundGenerator._to_stereo(wave)
     
     @staticmethod
     def generate_chime(base_freq: float, duration: float = 0.5,
                       volume: float = 0.4) -> np.ndarray:
         """Generate a pleasant chime with harmonics."""
         num_samples = int(ProceduralSoundGenerator.SAMPLE_RATE * duration)
-        t = np.linspace(0, duration, num_samples, False)
+        t = ProceduralSoundGenerator._time_axis(num_samples, duration)
         
         # Multiple harmonics for rich sound
-        wave = np.zeros(num_samples)
+        wave = np.zeros(num_samples, dtype=np.float32)
         harmonics = [1, 2, 3, 4, 5]
         amplitudes = [1.0, 0.5, 0.25, 0.125, 0.0625]
         
@@ -181,46 +230,46 @@ class ProceduralSoundGenerator:
         envelope = np.exp(-t * 4 / duration)
         wave = wave * envelope * volume
         
-        wave = (wave * 32767).astype(np.int16)
-        return np.column_stack((wave, wave))
+        return ProceduralSoundGenerator._to_stereo(wave)
     
     @staticmethod
     def generate_alarm(frequency: float, duration: float = 0.5,
                       pulses: int = 3, volume: float = 0.5) -> np.ndarray:
         """Generate an alarm/warning sound."""
         num_samples = int(ProceduralSoundGenerator.SAMPLE_RATE * duration)
-        t = np.linspace(0, duration, num_samples, False)
+        t = ProceduralSoundGenerator._time_axis(num_samples, duration)
         
         # Pulsing envelope
         pulse_freq = pulses / duration
         envelope = (np.sin(2 * np.pi * pulse_freq * t) + 1) / 2
         
-        # Two-tone alarm
-        wave1 = np.sin(2 * np.pi * frequency * t)
-        wave2 = np.sin(2 * np.pi * frequency * 1.2 * t)
-        
-        # Alternate between tones
+        # Two-tone alarm: pick each sample's angular frequency first, so
+        # only one full-length sine is evaluated instead of both tones
         selector = np.sin(2 * np.pi * pulse_freq * 2 * t) > 0
-        wave = np.where(selector, wave1, wave2)
+        omega = np.where(selector,
+                         np.float32(2 * np.pi * frequency),
+                         np.float32(2 * np.pi * frequency * 1.2))
+        omega *= t
+        wave = np.sin(omega, out=omega)
         
-        wave = wave * envelope * volume
+        wave *= envelope
+        wave *= volume
         
         # Fade out at end
         fade_samples = int(num_samples * 0.1)
         wave[-fade_samples:] *= np.linspace(1, 0, fade_samples)
         
-        wave = (wave * 32767).astype(np.int16)
-        return np.column_stack((wave, wave))
+        return ProceduralSoundGenerator._to_stereo(wave)
     
     @staticmethod
     def generate_whoosh(duration: float = 0.3, volume: float = 0.4,
                        direction: str = 'up') -> np.ndarray:
         """Generate a whoosh/swoosh sound."""
         num_samples = int(ProceduralSoundGenerator.SAMPLE_RATE * duration)
-        t = np.linspace(0, duration, num_samples, False)
+        t = ProceduralSoundGenerator._time_axis(num_samples, duration)
         
         # Filtered noise with frequency modulation
-        noise = np.random.uniform(-1, 1, num_samples)
+        noise = np.random.uniform(-1, 1, num_samples).astype(np.float32)
         
         # Frequency envelope
         if direction == 'up':
@@ -228,36 +277,39 @@ class ProceduralSoundGenerator:
         else:
             freq_mult = np.linspace(1.0, 0.2, num_samples)
         
-        # Simple low-pass by averaging
+        # Simple low-pass by averaging: a centred moving average taken as
+        # differences of a running sum, aligned like convolve(mode='same')
         kernel_size = 10
-        kernel = np.ones(kernel_size) / kernel_size
-        noise = np.convolve(noise, kernel, mode='same')
+        running = np.cumsum(np.concatenate((
+            np.zeros(kernel_size // 2 + 1, dtype=np.float32), noise,
+            np.zeros((kernel_size - 1) // 2, dtype=np.float32)
+        )))
+        noise = (running[kernel_size:] - running[:-kernel_size]) / kernel_size
         
         # Amplitude envelope
         envelope = np.sin(np.pi * t / duration) * volume
         
         wave = noise * envelope * freq_mult
-        wave = (wave * 32767).astype(np.int16)
-        return np.column_stack((wave, wave))
+        return ProceduralSoundGenerator._to_stereo(wave)
     
     @staticmethod
     def generate_rewind(duration: float = 0.8, volume: float = 0.5) -> np.ndarray:
         """Generate a tape rewind effect."""
         num_samples = int(ProceduralSoundGenerator.SAMPLE_RATE * duration)
-        t = np.linspace(0, duration, num_samples, False)
+        t = ProceduralSoundGenerator._time_axis(num_samples, duration)
         
         # Multiple descending tones
-        wave = np.zeros(num_samples)
+        wave = np.zeros(num_samples, dtype=np.float32)
         
         for i in range(5):
             freq_start = 2000 - i * 300
             freq_end = 100 + i * 50
             freq = freq_start * (freq_end / freq_start) ** (t / duration)
-            phase = 2 * np.pi * np.cumsum(freq) / ProceduralSoundGenerator.SAMPLE_RATE
+            phase = ProceduralSoundGenerator._phase(freq)
             wave += np.sin(phase) * (0.3 ** i)
         
         # Add some noise texture
-        noise = np.random.uniform(-0.2, 0.2, num_samples)
+        noise = np.random.uniform(-0.2, 0.2, num_samples).astype(np.float32)
         wave = wave + noise
         
         # Normalize and apply envelope
@@ -265,18 +317,17 @@ class ProceduralSoundGenerator:
         envelope = 1 - (t / duration) ** 2  # Quick start, slow fade
         wave = wave * envelope * volume
         
-        wave = (wave * 32767).astype(np.int16)
-        return np.column_stack((wave, wave))
+        return ProceduralSoundGenerator._to_stereo(wave)
     
     @staticmethod
     def generate_power_up(duration: float = 0.6, volume: float = 0.5) -> np.ndarray:
         """Generate a power-up/burst sound."""
         num_samples = int(ProceduralSoundGenerator.SAMPLE_RATE * duration)
-        t = np.linspace(0, duration, num_samples, False)
+        t = ProceduralSoundGenerator._time_axis(num_samples, duration)
         
         # Rising frequency
         freq = 200 + 800 * (t / duration) ** 2
-        phase = 2 * np.pi * np.cumsum(freq) / ProceduralSoundGenerator.SAMPLE_RATE
+        phase = ProceduralSoundGenerator._phase(freq)
         wave = np.sin(phase)
         
         # Add harmonics
@@ -287,8 +338,7 @@ class ProceduralSoundGenerator:
         envelope = np.sin(np.pi * t / duration) ** 0.5
         wave = wave * envelope * volume / 1.75
         
-        wave = (wave * 32767).astype(np.int16)
-        return np.column_stack((wave, wave))
+        return ProceduralSoundGenerator._to_stereo(wave)
 
 
 class AudioManager:
@@ -438,8 +488,14 @@ class AudioManager:
         return result
     
     def _create_sound(self, samples: np.ndarray) -> pygame.mixer.Sound:
-        """Create a pygame Sound from numpy array."""
-        return pygame.mixer.Sound(buffer=samples.tobytes())
+        """
+        Create a pygame Sound from numpy array.
+        
+        The Sound copies the samples through the buffer protocol into its
+        own mixer chunk, so no bytes copy is made and the array can be
+        dropped as soon as this returns.
+        """
+        return pygame.mixer.Sound(buffer=samples)
     
     def play(self, sound_type: SoundType, volume: float = 1.0, loop: bool = False) -> None:
         """
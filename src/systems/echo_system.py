@@ -45,8 +45,9 @@ class EntityEcho:
     """
     Echo trail for a single entity.
     
-    Contains multiple EchoFrames representing the entity's
-    predicted path through time.
+    Frames are stored as parallel lists (positions, timestamps, alphas)
+    rather than one EchoFrame object per prediction, so a refresh only
+    rewrites plain tuples and rendering walks flat lists.
     """
     
     def __init__(self, entity_id: str, color: Tuple[int, int, int]):
@@ -59,8 +60,21 @@ class EntityEcho:
         """
         self.entity_id = entity_id
         self.color = color
-        self.frames: List[EchoFrame] = []
+        self.positions: List[Tuple[float, float]] = []
+        self.timestamps: List[float] = []
+        self.alphas: List[int] = []
         self.size = (32, 32)  # Default size, updated from entity
+        
+        # Echo shapes keyed by alpha; the fade sequence repeats every update
+        self._surface_cache: Dict[int, pygame.Surface] = {}
+    
+    @property
+    def frames(self) -> List[EchoFrame]:
+        """Echo frames as EchoFrame objects (built on demand)."""
+        return [
+            EchoFrame(position=Vector2(x, y), timestamp=t, alpha=a)
+            for (x, y), t, a in zip(self.positions, self.timestamps, self.alphas)
+        ]
     
     def update_prediction(self, positions: List[Tuple[Vector2, float]], 
                          base_alpha: int = Settings.ECHO_BASE_ALPHA) -> None:
@@ -71,16 +85,27 @@ class EntityEcho:
             positions: List of (position, timestamp) tuples
             base_alpha: Starting alpha value
         """
-        self.frames.clear()
+        self.positions = [(pos.x, pos.y) for pos, _ in positions]
+        self.timestamps = [timestamp for _, timestamp in positions]
         
-        alpha = base_alpha
-        for pos, timestamp in positions:
-            self.frames.append(EchoFrame(
-                position=pos.copy(),
-                timestamp=timestamp,
-                alpha=int(alpha)
-            ))
-            alpha *= Settings.ECHO_FADE_RATE
+        alphas = self.alphas
+        if len(alphas) != len(positions) or (alphas and alphas[0] != int(base_alpha)):
+            alphas = []
+            alpha = base_alpha
+            for _ in positions:
+                alphas.append(int(alpha))
+                alpha *= Settings.ECHO_FADE_RATE
+            self.alphas = alphas
+    
+    def _get_surface(self, alpha: int) -> pygame.Surface:
+        """Get (or build once) the echo shape for an alpha value."""
+        surface = self._surface_cache.get(alpha)
+        if surface is None:
+            surface = pygame.Surface(self.size, pygame.SRCALPHA)
+            pygame.draw.rect(surface, (*self.color, alpha),
+                           (0, 0, self.size[0], self.size[1]))
+            self._surface_cache[alpha] = surface
+        return surface
     
     def render(self, screen: pygame.Surface, offset: Vector2 = None) -> None:
         """
@@ -90,20 +115,13 @@ class EntityEcho:
             screen: Surface to render to
             offset: Optional camera offset
         """
-        offset = offset or Vector2.zero()
+        ox, oy = (offset.x, offset.y) if offset else (0, 0)
+        get_surface = self._get_surface
         
-        for frame in self.frames:
-            # Create echo surface
-            echo_surface = pygame.Surface(self.size, pygame.SRCALPHA)
-            
-            # Draw echo shape (simple rectangle with alpha)
-            echo_color = (*self.color, frame.alpha)
-            pygame.draw.rect(echo_surface, echo_color, 
-                           (0, 0, self.size[0], self.size[1]))
-            
-            # Draw at predicted position
-            pos = frame.position + offset
-            screen.blit(echo_surface, pos.int_tuple)
+        screen.blits([
+            (get_surface(alpha), (int(x + ox), int(y + oy)))
+            for (x, y), alpha in zip(self.positions, self.alphas)
+        ], False)
 
 
 class EchoSystem:
@@ -143,7 +143,7 @@ class TimeReversalSystem:
                 if hasattr(entity, 'id') and hasattr(entity, 'position'):
                     entity_states[entity.id] = {
                         'position': entity.position.copy() if hasattr(entity.position, 'copy') else Vector2(entity.position.x, entity.position.y),
-                        'velocity': getattr(entity, 'velocity', Vector2.zero()),
+                        'velocity': entity.velocity.copy() if hasattr(entity, 'velocity') else Vector2.zero(),
                         'active': getattr(entity, 'active', True)
                     }
             
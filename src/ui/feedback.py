@@ -8,7 +8,7 @@ enhanced vignette, and tighter flash decay for snappy feel.
 import pygame
 import random
 import math
-from typing import Tuple, Optional
+from typing import List, Tuple, Optional
 
 from ..core.settings import Settings, COLORS
 from ..core.utils import Vector2, lerp
@@ -59,7 +59,7 @@ class ScreenEffects:
         self._vignette_surface = pygame.Surface(
             (Settings.SCREEN_WIDTH, Settings.SCREEN_HEIGHT),
             pygame.SRCALPHA
-        )
+        ).convert_alpha()
         cx = Settings.SCREEN_WIDTH // 2
         cy = Settings.SCREEN_HEIGHT // 2
         max_dist = math.sqrt(cx ** 2 + cy ** 2)
@@ -76,14 +76,14 @@ class ScreenEffects:
         self._scanline_surface = pygame.Surface(
             (Settings.SCREEN_WIDTH, Settings.SCREEN_HEIGHT),
             pygame.SRCALPHA
-        )
+        ).convert_alpha()
         for y in range(0, Settings.SCREEN_HEIGHT, 3):
             pygame.draw.line(self._scanline_surface, (0, 0, 0, 18),
                            (0, y), (Settings.SCREEN_WIDTH, y))
     
     def update(self, dt: float) -> None:
-        # Shake decay
-        self._shake_intensity *= Settings.SHAKE_DECAY
+        # Shake decay (SHAKE_DECAY is per 60 Hz frame; scale to the step)
+        self._shake_intensity *= Settings.SHAKE_DECAY ** (dt * 60)
         if self._shake_intensity < 0.5:
             self._shake_intensity = 0
             self._shake_offset = Vector2.zero()
@@ -93,22 +93,23 @@ class ScreenEffects:
                 random.uniform(-1, 1) * self._shake_intensity
             )
         
-        # Lerp tint
+        # Lerp tint (kept as floats; truncating every step stalls short of
+        # the target once a step moves less than one unit)
         self._tint_color = (
-            int(lerp(self._tint_color[0], self._target_tint[0], dt * 3)),
-            int(lerp(self._tint_color[1], self._target_tint[1], dt * 3)),
-            int(lerp(self._tint_color[2], self._target_tint[2], dt * 3)),
-            int(lerp(self._tint_color[3], self._target_tint[3], dt * 3))
+            lerp(self._tint_color[0], self._target_tint[0], dt * 3),
+            lerp(self._tint_color[1], self._target_tint[1], dt * 3),
+            lerp(self._tint_color[2], self._target_tint[2], dt * 3),
+            lerp(self._tint_color[3], self._target_tint[3], dt * 3)
         )
         
         # Flash decay (faster for snappy feel)
-        self._flash_alpha = max(0, self._flash_alpha - int(dt * 600))
+        self._flash_alpha = max(0, self._flash_alpha - dt * 600)
         
         # Freeze overlay
         if self._freeze_active:
-            self._freeze_alpha = min(60, self._freeze_alpha + int(dt * 350))
+            self._freeze_alpha = min(60, self._freeze_alpha + dt * 350)
         else:
-            self._freeze_alpha = max(0, self._freeze_alpha - int(dt * 400))
+            self._freeze_alpha = max(0, self._freeze_alpha - dt * 400)
         
         # Smooth chromatic aberration
         self._chromatic_offset = lerp(self._chromatic_offset, self._target_chromatic, dt * 4)
@@ -193,16 +194,18 @@ class ScreenEffects:
                 pygame.SRCALPHA
             )
             ft = freeze_tint[:3]
-            freeze_surface.fill((ft[0], ft[1], ft[2], min(255, max(0, self._freeze_alpha))))
+            freeze_surface.fill((ft[0], ft[1], ft[2], int(min(255, max(0, self._freeze_alpha)))))
             screen.blit(freeze_surface, (0, 0))
         
         # Debt tint
-        if self._tint_color[3] > 0:
+        tint = (int(self._tint_color[0]), int(self._tint_color[1]),
+                int(self._tint_color[2]), int(self._tint_color[3]))
+        if tint[3] > 0:
             tint_surface = pygame.Surface(
                 (Settings.SCREEN_WIDTH, Settings.SCREEN_HEIGHT),
                 pygame.SRCALPHA
             )
-            tint_surface.fill(self._tint_color)
+            tint_surface.fill(tint)
             screen.blit(tint_surface, (0, 0))
         
         # Scan lines (at high tier)
@@ -222,7 +225,7 @@ class ScreenEffects:
                 pygame.SRCALPHA
             )
             fc = self._flash_color
-            flash_surface.fill((fc[0], fc[1], fc[2], min(255, max(0, self._flash_alpha))))
+            flash_surface.fill((fc[0], fc[1], fc[2], int(min(255, max(0, self._flash_alpha)))))
             screen.blit(flash_surface, (0, 0))
 
 
@@ -272,8 +275,54 @@ class ParticleSystem:
                 'size': size
             })
     
+    def emit_many(self, positions: List[Vector2], counts: List[int],
+                  color: Tuple[int, int, int] = COLORS.WHITE,
+                  speeds: List[float] = None, lifetime: float = 1.0,
+                  size: int = 4) -> None:
+        """
+        Emit several bursts of one color in a single call.
+        
+        Equivalent to calling emit() once per position, but the free
+        capacity and the random helpers are resolved once for all bursts.
+        
+        Args:
+            positions: Emission centers
+            counts: Number of particles per center
+            color: Particle color
+            speeds: Initial velocity magnitude per center (default 50)
+            lifetime: How long particles live
+            size: Particle size
+        """
+        free = self.max_particles - len(self.particles)
+        if free <= 0:
+            return
+        
+        uniform = random.uniform
+        from_angle = Vector2.from_angle
+        two_pi = math.pi * 2
+        new_particles = []
+        
+        for i, (position, count) in enumerate(zip(positions, counts)):
+            speed = speeds[i] if speeds else 50
+            for _ in range(min(count, free)):
+                new_particles.append({
+                    'position': position.copy(),
+                    'velocity': from_angle(uniform(0, two_pi),
+                                           uniform(speed * 0.5, speed)),
+                    'color': color,
+                    'lifetime': lifetime,
+                    'max_lifetime': lifetime,
+                    'size': size
+                })
+            free -= min(count, free)
+            if free <= 0:
+                break
+        
+        self.particles.extend(new_particles)
+    
     def update(self, dt: float) -> None:
         """Update all particles."""
+        friction = 0.98 ** (dt * 60)
         for particle in self.particles[:]:
             particle['lifetime'] -= dt
             if particle['lifetime'] <= 0:
@@ -284,8 +333,8 @@ class ParticleSystem:
             particle['position'] = (particle['position'] + 
                                    particle['velocity'] * dt)
             
-            # Apply friction
-            particle['velocity'] = particle['velocity'] * 0.98
+            # Apply friction (2% per 60 Hz frame, scaled to the step)
+            particle['velocity'] = particle['velocity'] * friction
     
     def render(self, screen: pygame.Surface) -> None:
         """Render all particles."""
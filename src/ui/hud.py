@@ -7,6 +7,7 @@ color-graded debt meter, and pulsing warning indicators.
 
 import pygame
 import math
+from typing import Dict
 
 
 from ..core.settings import Settings, COLORS
@@ -60,6 +61,10 @@ class HUD:
         
         self._momentum_display = 0.0
         self._fragment_pulse = 0.0
+        
+        # Rendered text keyed by (font, string, color); most HUD strings
+        # are formatted to display precision and repeat frame to frame
+        self._text_cache: Dict[tuple, pygame.Surface] = {}
     
     def set_systems(self, debt_manager, time_engine, anchor_system, level_manager):
         self._debt_manager = debt_manager
@@ -108,6 +113,19 @@ class HUD:
             self._render_fps(screen)
     
     # -- helper --
+    def _text(self, font: pygame.font.Font, text: str, color) -> pygame.Surface:
+        """Render antialiased text, reusing the surface while it repeats."""
+        key = (font, text, tuple(color))
+        surface = self._text_cache.get(key)
+        if surface is None:
+            # Pulsing colors and ticking timers keep adding keys; start
+            # over rather than let the cache grow without bound
+            if len(self._text_cache) >= 256:
+                self._text_cache.clear()
+            surface = font.render(text, True, color)
+            self._text_cache[key] = surface
+        return surface
+    
     def _panel(self, screen, x, y, w, h, border_color=None, alpha=170):
         """Draw a dark translucent panel with an optional accent border."""
         s = pygame.Surface((w, h), pygame.SRCALPHA)
@@ -177,10 +195,10 @@ class HUD:
             debt_text = f"DEBT {self._debt_display:.1f}s"
             tier_name = Settings.DEBT_TIERS[tier]['name'].upper()
             
-            text_surface = self.font_tiny.render(debt_text, True, (160, 170, 200))
+            text_surface = self._text(self.font_tiny, debt_text, (160, 170, 200))
             screen.blit(text_surface, (x + 2, y + self.bar_height + 4))
             
-            tier_surface = self.font_tiny.render(tier_name, True, fill_color)
+            tier_surface = self._text(self.font_tiny, tier_name, fill_color)
             screen.blit(tier_surface, (x + self.bar_width - tier_surface.get_width() - 2, y + self.bar_height + 4))
     
     def _render_freeze_indicator(self, screen: pygame.Surface) -> None:
@@ -200,7 +218,7 @@ class HUD:
             )
             
             text = "TIME FROZEN"
-            text_surface = self.font_large.render(text, True, color)
+            text_surface = self._text(self.font_large, text, color)
             text_rect = text_surface.get_rect(centerx=center_x, top=y)
             
             bg_rect = text_rect.inflate(24, 12)
@@ -210,14 +228,14 @@ class HUD:
             screen.blit(text_surface, text_rect)
             
             duration_text = f"+{self._time_engine.freeze_duration:.1f}s"
-            duration_surface = self.font_small.render(duration_text, True, (180, 200, 240))
+            duration_surface = self._text(self.font_small, duration_text, (180, 200, 240))
             duration_rect = duration_surface.get_rect(centerx=center_x, top=text_rect.bottom + 6)
             screen.blit(duration_surface, duration_rect)
         else:
             if self._time_engine.time_scale > 1.0:
                 speed_text = f"TIME: {self._time_engine.time_scale:.1f}x"
                 sc = getattr(COLORS, 'TIER_SEVERE', (220, 140, 40))
-                text_surface = self.font_medium.render(speed_text, True, sc)
+                text_surface = self._text(self.font_medium, speed_text, sc)
                 text_rect = text_surface.get_rect(centerx=center_x, top=y)
                 screen.blit(text_surface, text_rect)
     
@@ -258,12 +276,12 @@ class HUD:
             
             pygame.draw.rect(screen, (50, 60, 90), slot_rect, 1, border_radius=4)
             
-            num_surface = self.font_tiny.render(str(i + 1), True, (100, 110, 140))
+            num_surface = self._text(self.font_tiny, str(i + 1), (100, 110, 140))
             num_rect = num_surface.get_rect(center=(sx + slot_size // 2, y + slot_size // 2))
             screen.blit(num_surface, num_rect)
         
         instr_text = "Q: Place  E: Recall"
-        instr_surface = self.font_tiny.render(instr_text, True, (80, 90, 120))
+        instr_surface = self._text(self.font_tiny, instr_text, (80, 90, 120))
         screen.blit(instr_surface, (x_start, y + slot_size + 4))
     
     def _render_level_info(self, screen: pygame.Surface) -> None:
@@ -286,24 +304,24 @@ class HUD:
         
         accent = getattr(COLORS, 'MENU_ACCENT', (0, 200, 255))
         name_text = f"LEVEL {level_num}: {level_name}"
-        name_surface = self.font_medium.render(name_text, True, accent)
+        name_surface = self._text(self.font_medium, name_text, accent)
         screen.blit(name_surface, (x + 10, y + 6))
         
         time_val = info.get('time', 0)
         time_text = f"{time_val:.1f}s"
-        time_surface = self.font_tiny.render(time_text, True, (120, 140, 170))
+        time_surface = self._text(self.font_tiny, time_text, (120, 140, 170))
         screen.blit(time_surface, (x + 10, y + 32))
         
         hint = info.get('hint', '')
         if hint and time_val < 5.0:
             hint_alpha = int(200 * max(0, 1 - time_val / 5.0))
-            hint_surface = self.font_small.render(hint, True, (hint_alpha, hint_alpha, int(hint_alpha * 0.7)))
+            hint_surface = self._text(self.font_small, hint, (hint_alpha, hint_alpha, int(hint_alpha * 0.7)))
             hint_rect = hint_surface.get_rect(centerx=Settings.SCREEN_WIDTH // 2, bottom=Settings.SCREEN_HEIGHT - 40)
             screen.blit(hint_surface, hint_rect)
     
     def _render_fps(self, screen: pygame.Surface) -> None:
         fps_text = "60 FPS"
-        fps_surface = self.font_tiny.render(fps_text, True, (60, 70, 90))
+        fps_surface = self._text(self.font_tiny, fps_text, (60, 70, 90))
         screen.blit(fps_surface, 
                    (Settings.SCREEN_WIDTH - fps_surface.get_width() - self.margin,
                     Settings.SCREEN_HEIGHT - fps_surface.get_height() - self.margin))
@@ -319,7 +337,7 @@ class HUD:
             "ESC - Pause",
         ]
         for i, text in enumerate(controls):
-            surface = self.font_tiny.render(text, True, (70, 80, 100))
+            surface = self._text(self.font_tiny, text, (70, 80, 100))
             screen.blit(surface, (x, y + i * 18))
     
     # ============================================
@@ -352,11 +370,11 @@ class HUD:
         
         pygame.draw.rect(screen, (50, 60, 90), bg_rect, 1, border_radius=3)
         
-        label_surface = self.font_tiny.render("MOMENTUM", True, (100, 110, 140))
+        label_surface = self._text(self.font_tiny, "MOMENTUM", (100, 110, 140))
         screen.blit(label_surface, (x, y - 16))
         
         value_text = f"{self._momentum_display:.1f}x"
-        value_surface = self.font_tiny.render(value_text, True, (180, 200, 240))
+        value_surface = self._text(self.font_tiny, value_text, (180, 200, 240))
         value_rect = value_surface.get_rect(right=x + bar_width, top=y - 16)
         screen.blit(value_surface, value_rect)
     
@@ -404,7 +422,7 @@ class HUD:
             label = "FRAGMENTS"
             label_color = (100, 110, 140)
         
-        label_surface = self.font_tiny.render(label, True, label_color)
+        label_surface = self._text(self.font_tiny, label, label_color)
         screen.blit(label_surface, (x, y - 16))
     
     def _render_ability_cooldowns(self, screen: pygame.Surface) -> None:
@@ -431,7 +449,7 @@ class HUD:
             ct = "[C] Clone Ready"
             cc = accent
         
-        screen.blit(self.font_tiny.render(ct, True, cc), (x + 8, y + 6))
+        screen.blit(self._text(self.font_tiny, ct, cc), (x + 8, y + 6))
         
         # Rewind
         rev_avail = self._v2_data.get('reversal_available', False)
@@ -444,7 +462,7 @@ class HUD:
             rt = "[R] Rewind: USED"
             rc = (60, 60, 80)
         
-        screen.blit(self.font_tiny.render(rt, True, rc), (x + 8, y + 24))
+        screen.blit(self._text(self.font_tiny, rt, rc), (x + 8, y + 24))
         
         # Resonance
         res_state = self._v2_data.get('resonance_state', 'idle')
@@ -460,4 +478,4 @@ class HUD:
             rs_t = f"Wave: {int(res_prog * 100)}%"
             rs_c = (80, 90, 120)
         
-        screen.blit(self.font_tiny.render(rs_t, True, rs_c), (x + 8, y + 44))
+        screen.blit(self._text(self.font_tiny, rs_t, rs_c), (x + 8, y + 44))
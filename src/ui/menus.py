@@ -247,7 +247,7 @@ class MainMenu(BaseMenu):
     def update(self, dt: float) -> None:
         super().update(dt)
         self._title_time += dt
-        self._subtitle_alpha = min(255, self._subtitle_alpha + int(dt * 150))
+        self._subtitle_alpha = min(255, self._subtitle_alpha + dt * 150)
     
     def render(self, screen: pygame.Surface) -> None:
         self._render_background(screen)
@@ -301,7 +301,7 @@ class MainMenu(BaseMenu):
         # Subtitle — psychological hook
         subtitle = "Time is a loan you cannot afford."
         if self._subtitle_alpha > 0:
-            sub_alpha = min(255, self._subtitle_alpha)
+            sub_alpha = int(min(255, self._subtitle_alpha))
             sub_surf = self.font_medium.render(subtitle, True,
                                                (150, 160, 180))
             sub_surf.set_alpha(sub_alpha)
@@ -370,15 +370,19 @@ class PauseMenu(BaseMenu):
         ]
         self.items[0].selected = True
         self._anim_time = 0.0
+        self._overlay: Optional[pygame.Surface] = None  # Built on first render
     
     def update(self, dt: float):
         super().update(dt)
         self._anim_time += dt
     
     def render(self, screen: pygame.Surface) -> None:
-        overlay = pygame.Surface((Settings.SCREEN_WIDTH, Settings.SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((6, 8, 16, 210))
-        screen.blit(overlay, (0, 0))
+        if self._overlay is None:
+            self._overlay = pygame.Surface(
+                (Settings.SCREEN_WIDTH, Settings.SCREEN_HEIGHT), pygame.SRCALPHA
+            ).convert_alpha()
+            self._overlay.fill((6, 8, 16, 210))
+        screen.blit(self._overlay, (0, 0))
         
         accent = getattr(COLORS, 'MENU_ACCENT', (0, 200, 255))
         glow = (math.sin(self._anim_time * 3) + 1) / 2
@@ -424,6 +428,10 @@ class GameOverScreen(BaseMenu):
         
         self.death_message = "TIME BANKRUPTCY"
         self._anim_time = 0.0
+        
+        # Full-screen layers, built on first render
+        self._overlay: Optional[pygame.Surface] = None
+        self._scanlines: Optional[pygame.Surface] = None
     
     def set_death_message(self, message: str) -> None:
         self.death_message = message
@@ -433,17 +441,23 @@ class GameOverScreen(BaseMenu):
         self._anim_time += dt
     
     def render(self, screen: pygame.Surface) -> None:
-        # Deep red-magenta overlay
-        overlay = pygame.Surface((Settings.SCREEN_WIDTH, Settings.SCREEN_HEIGHT), pygame.SRCALPHA)
+        if self._overlay is None:
+            self._overlay = pygame.Surface(
+                (Settings.SCREEN_WIDTH, Settings.SCREEN_HEIGHT), pygame.SRCALPHA
+            ).convert_alpha()
+            self._scanlines = pygame.Surface(
+                (Settings.SCREEN_WIDTH, Settings.SCREEN_HEIGHT), pygame.SRCALPHA
+            ).convert_alpha()
+            for y in range(0, Settings.SCREEN_HEIGHT, 3):
+                pygame.draw.line(self._scanlines, (0, 0, 0, 30), (0, y), (Settings.SCREEN_WIDTH, y))
+        
+        # Deep red-magenta overlay (pulsing, so refilled each frame)
         pulse = (math.sin(self._anim_time * 2) + 1) / 2
-        overlay.fill((int(40 + 30 * pulse), 5, int(15 + 10 * pulse), 225))
-        screen.blit(overlay, (0, 0))
+        self._overlay.fill((int(40 + 30 * pulse), 5, int(15 + 10 * pulse), 225))
+        screen.blit(self._overlay, (0, 0))
         
         # Scan lines effect
-        scan = pygame.Surface((Settings.SCREEN_WIDTH, Settings.SCREEN_HEIGHT), pygame.SRCALPHA)
-        for y in range(0, Settings.SCREEN_HEIGHT, 3):
-            pygame.draw.line(scan, (0, 0, 0, 30), (0, y), (Settings.SCREEN_WIDTH, y))
-        screen.blit(scan, (0, 0))
+        screen.blit(self._scanlines, (0, 0))
         
         # Glitchy title
         title_text = "GAME OVER"
@@ -508,6 +522,7 @@ class VictoryScreen(BaseMenu):
         self._anim_time = 0.0
         
         self._celebration_particles: List[Particle] = []
+        self._overlay: Optional[pygame.Surface] = None  # Built on first render
     
     def set_stats(self, level_name: str, time: float, debt: float, is_final: bool = False):
         self.level_name = level_name
@@ -555,9 +570,12 @@ class VictoryScreen(BaseMenu):
     
     def render(self, screen: pygame.Surface) -> None:
         # Deep teal overlay
-        overlay = pygame.Surface((Settings.SCREEN_WIDTH, Settings.SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((6, 25, 30, 215))
-        screen.blit(overlay, (0, 0))
+        if self._overlay is None:
+            self._overlay = pygame.Surface(
+                (Settings.SCREEN_WIDTH, Settings.SCREEN_HEIGHT), pygame.SRCALPHA
+            ).convert_alpha()
+            self._overlay.fill((6, 25, 30, 215))
+        screen.blit(self._overlay, (0, 0))
         
         # Celebration particles
         for p in self._celebration_particles:
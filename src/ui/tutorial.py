@@ -178,7 +178,7 @@ class TutorialOverlay:
         
         # Handle transitioning
         if self.transitioning:
-            self.fade_alpha = max(0, self.fade_alpha - int(dt * 500))
+            self.fade_alpha = max(0, self.fade_alpha - dt * 500)
             if self.fade_alpha <= 0:
                 self.transitioning = False
                 self.fade_alpha = 255